@@ -62,9 +62,11 @@ class AudioPlayer:
 
     def add_audio(self, audio_data):
         """Add audio data to the buffer."""
-        # Convert float32 to int16 if needed
+        # Convert float32 to int16 if needed, saturating instead of wrapping
         if isinstance(audio_data, np.ndarray) and audio_data.dtype == np.float32:
-            audio_data = (audio_data * 32768.0).astype(np.int16)
+            scaled = np.multiply(audio_data, 32767.0)
+            np.clip(scaled, -32768.0, 32767.0, out=scaled)
+            audio_data = scaled.astype(np.int16)
 
         with self.output_lock:
             if isinstance(audio_data, bytes) or isinstance(audio_data, bytearray):
@@ -184,9 +186,8 @@ async def push_audio(
     # Simulate streaming audio bytes
     chunk_size = sr // 100
     for i in range(0, len(audio_np), chunk_size):
-        chunk = audio_np[i : i + chunk_size]
-        # Send to runtime
-        await runtime.push_audio(chunk.tobytes(), sr, last_chunk=False)
+        # Send to runtime; int16 slices are views, so no per-chunk copy
+        await runtime.push_audio(audio_np[i : i + chunk_size], sr, last_chunk=False)
 
     # Flush the audio, mark the end of speech
     await runtime.flush()
@@ -221,11 +222,14 @@ async def run_bithuman(
             if sleep_time > 0:
                 await asyncio.sleep(sleep_time)
 
-            # Display frame and get key press
-            exp_time = runtime.get_expiration_time()
-            key = await video_player.display_frame(
-                frame, fps_controller.average_fps, exp_time
-            )
+            # Display frame and get key press. When more than a frame behind
+            # schedule, skip rendering so video catches up; audio still plays.
+            key = -1
+            if sleep_time > -fps_controller.frame_interval:
+                exp_time = runtime.get_expiration_time()
+                key = await video_player.display_frame(
+                    frame, fps_controller.average_fps, exp_time
+                )
             # Add audio to the buffer
             if frame.audio_chunk and audio_player.is_started():
                 audio_player.add_audio(frame.audio_chunk.array)  # int16 16kHz mono
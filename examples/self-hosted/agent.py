@@ -62,10 +62,16 @@ class BithumanVideoGenerator(VideoGenerator):
     Integrates native AsyncBithuman with advanced streaming capabilities.
     """
 
+    # Agent audio is coalesced into runtime pushes of at least this many ms
+    AUDIO_BATCH_MS = 40
+
     def __init__(self, bithuman_runtime: AsyncBithuman):
         """Initialize with an AsyncBithuman runtime instance."""
         self._runtime = bithuman_runtime
         self._first_frame_cache: Optional[np.ndarray] = None
+        # Agent audio not yet pushed to the runtime, and its sample rate
+        self._pending_audio = bytearray()
+        self._pending_sample_rate = 0
 
     @property
     def video_resolution(self) -> tuple[int, int]:
@@ -101,15 +107,33 @@ class BithumanVideoGenerator(VideoGenerator):
     async def push_audio(self, frame: rtc.AudioFrame | AudioSegmentEnd) -> None:
         """Push audio frame to BitHuman runtime for processing."""
         if isinstance(frame, AudioSegmentEnd):
+            await self._push_pending_audio()
             await self._runtime.flush()
             return
 
+        if frame.sample_rate != self._pending_sample_rate:
+            await self._push_pending_audio()
+            self._pending_sample_rate = frame.sample_rate
+
+        # Agent frames are typically 10-20ms; batch them so each runtime push
+        # carries more audio. Appending the frame's buffer copies it only once.
+        self._pending_audio += frame.data
+        if len(self._pending_audio) >= self.AUDIO_BATCH_MS * frame.sample_rate // 500:
+            await self._push_pending_audio()
+
+    async def _push_pending_audio(self) -> None:
+        """Push any batched agent audio to the BitHuman runtime."""
+        if not self._pending_audio:
+            return
+        audio = bytes(self._pending_audio)
+        self._pending_audio.clear()
         await self._runtime.push_audio(
-            bytes(frame.data), frame.sample_rate, last_chunk=False
+            audio, self._pending_sample_rate, last_chunk=False
         )
 
     def clear_buffer(self) -> None:
         """Clear BitHuman runtime buffer (interrupt current processing)."""
+        self._pending_audio.clear()
         self._runtime.interrupt()
 
     def __aiter__(
@@ -127,14 +151,37 @@ class BithumanVideoGenerator(VideoGenerator):
         """
 
         def create_video_frame(image: np.ndarray) -> rtc.VideoFrame:
-            """Create optimized video frame with RGBA conversion."""
-            # Convert BGR to RGBA for better LiveKit compatibility
-            rgba_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGBA)
+            """Create optimized video frame in the encoder's I420 format."""
+            height, width = image.shape[:2]
+            # cvtColor writes straight into the frame's own buffer, so there is no
+            # tobytes() copy; the buffer is fresh per frame because frames may
+            # still be queued.
+            if width % 2 == 0 and height % 2 == 0:
+                # I420 is what the WebRTC encoder consumes: 1.5 bytes per pixel
+                # instead of 4, and no RGBA->YUV conversion inside LiveKit
+                data = bytearray(width * height * 3 // 2)
+                cv2.cvtColor(
+                    image,
+                    cv2.COLOR_BGR2YUV_I420,
+                    dst=np.frombuffer(data, dtype=np.uint8).reshape(
+                        height * 3 // 2, width
+                    ),
+                )
+                buffer_type = rtc.VideoBufferType.I420
+            else:
+                # Chroma subsampling needs even dimensions; fall back to RGBA
+                data = bytearray(width * height * 4)
+                cv2.cvtColor(
+                    image,
+                    cv2.COLOR_BGR2RGBA,
+                    dst=np.frombuffer(data, dtype=np.uint8).reshape(height, width, 4),
+                )
+                buffer_type = rtc.VideoBufferType.RGBA
             return rtc.VideoFrame(
-                width=rgba_image.shape[1],
-                height=rgba_image.shape[0],
-                type=rtc.VideoBufferType.RGBA,
-                data=rgba_image.tobytes(),
+                width=width,
+                height=height,
+                type=buffer_type,
+                data=data,
             )
 
         frame_count = 0
@@ -177,10 +224,7 @@ class BithumanVideoGenerator(VideoGenerator):
         except asyncio.CancelledError:
             logger.info("BitHuman video generator streaming cancelled")
         except Exception as e:
-            logger.error(f"Error in BitHuman video generator: {e}")
-            import traceback
-
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error in BitHuman video generator: {e}")
 
     async def trigger_gesture(self, action: str) -> None:
         """Trigger a gesture in BitHuman runtime with advanced error handling."""
@@ -312,10 +356,7 @@ class ModernBithumanAgent:
             logger.info("🎭 Avatar runner started successfully")
 
         except Exception as e:
-            logger.error(f"❌ Failed to initialize BitHuman avatar: {e}")
-            import traceback
-
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"❌ Failed to initialize BitHuman avatar: {e}")
             raise
 
     async def handle_conversation_events(self) -> None:
@@ -72,6 +72,18 @@ except ImportError:
     logger.warning("sounddevice is not installed. Local audio I/O will not work.")
     sd = None
 
+# uvloop is optional and not available on Windows; fall back to asyncio's loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# soxr is optional; it resamples Gemini output far better than linear interpolation
+try:
+    import soxr
+except ImportError:
+    soxr = None
+
 try:
     from google import genai
     from google.genai import types
@@ -81,7 +93,8 @@ except ImportError:
 
 # Configure logging
 logger.remove()
-logger.add(sys.stdout, level="INFO")
+# enqueue moves sink writes to a background thread, off the event loop
+logger.add(sys.stdout, level="INFO", enqueue=True)
 
 # Gemini Live API constants
 GEMINI_INPUT_SAMPLE_RATE = 16000
@@ -116,6 +129,24 @@ def list_audio_devices():
     print("\nUse --audio-device <id> to select a specific input device")
 
 
+def set_realtime_priority(priority: int) -> None:
+    """Run the calling thread under SCHED_FIFO so audio/video pacing isn't preempted.
+
+    Linux only; needs CAP_SYS_NICE or an RLIMIT_RTPRIO of at least `priority`.
+    On Linux this changes only the calling thread. Threads it starts afterwards
+    (runtime, audio callbacks) inherit the policy; threads that already exist,
+    such as the loguru enqueue writer started at import, stay on SCHED_OTHER.
+    """
+    if not hasattr(os, "sched_setscheduler"):
+        logger.warning("Realtime scheduling is not supported on this platform")
+        return
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        logger.info(f"Running with SCHED_FIFO priority {priority}")
+    except OSError as e:
+        logger.warning(f"Could not enable realtime scheduling: {e}")
+
+
 class AudioPlayer:
     """Audio player that uses a buffer and callback for smooth playback."""
 
@@ -158,9 +189,11 @@ class AudioPlayer:
 
     def add_audio(self, audio_data):
         """Add audio data to the buffer."""
-        # Convert float32 to int16 if needed
+        # Convert float32 to int16 if needed, saturating instead of wrapping
         if isinstance(audio_data, np.ndarray) and audio_data.dtype == np.float32:
-            audio_data = (audio_data * 32768.0).astype(np.int16)
+            scaled = np.multiply(audio_data, 32767.0)
+            np.clip(scaled, -32768.0, 32767.0, out=scaled)
+            audio_data = scaled.astype(np.int16)
 
         with self.output_lock:
             if isinstance(audio_data, bytes) or isinstance(audio_data, bytearray):
@@ -654,6 +687,9 @@ class GeminiLiveAvatarApp:
         # State
         self._running = False
         self._current_transcription = ""
+        # Streaming soxr resampler for Gemini output; carries filter state
+        # across chunks and is dropped at turn end or on interruption
+        self._resample_stream = None
 
     async def initialize(self):
         """Initialize all components."""
@@ -773,6 +809,8 @@ class GeminiLiveAvatarApp:
         if command == "interrupt":
             # Interrupt current response
             self.bithuman_runtime.interrupt()
+            # Drop buffered resampler state so it doesn't leak into the next turn
+            self._resample_stream = None
             if self.audio_player:
                 self.audio_player.clear()
             if self.gemini_session:
@@ -824,16 +862,16 @@ class GeminiLiveAvatarApp:
         audio_np, sr = load_audio(audio_file)
         audio_np = float32_to_int16(audio_np)
 
-        # Simulate streaming audio bytes
-        chunk_size = sr // 100  # 10ms chunks
+        # Simulate streaming audio bytes; 100ms chunks keep runtime calls low
+        chunk_size = sr // 10
         for i in range(0, len(audio_np), chunk_size):
             if not self._running:
                 break
-            chunk = audio_np[i : i + chunk_size]
+            # int16 slices are views, so no per-chunk copy
             await self.bithuman_runtime.push_audio(
-                chunk.tobytes(), sr, last_chunk=False
+                audio_np[i : i + chunk_size], sr, last_chunk=False
             )
-            await asyncio.sleep(0.008)  # Small delay to simulate streaming
+            await asyncio.sleep(0.08)  # Small delay to simulate streaming
 
         # Flush to mark end of speech
         await self.bithuman_runtime.flush()
@@ -882,6 +920,7 @@ class GeminiLiveAvatarApp:
 
         # Buffer for resampling (24kHz -> 16kHz)
         resample_ratio = GEMINI_INPUT_SAMPLE_RATE / GEMINI_OUTPUT_SAMPLE_RATE
+        self._resample_stream = None
 
         # Keep running until explicitly stopped
         while self._running:
@@ -907,9 +946,19 @@ class GeminiLiveAvatarApp:
                         # Convert 24kHz Gemini output to 16kHz for bitHuman
                         audio_np = np.frombuffer(audio_data, dtype=np.int16)
 
-                        # Simple resampling (for production, use proper resampler)
-                        if resample_ratio != 1.0:
-                            # Linear interpolation resampling
+                        if resample_ratio != 1.0 and soxr is not None:
+                            if self._resample_stream is None:
+                                self._resample_stream = soxr.ResampleStream(
+                                    GEMINI_OUTPUT_SAMPLE_RATE,
+                                    GEMINI_INPUT_SAMPLE_RATE,
+                                    1,
+                                    dtype="int16",
+                                )
+                            audio_np = self._resample_stream.resample_chunk(
+                                audio_np
+                            )
+                        elif resample_ratio != 1.0:
+                            # Linear interpolation fallback when soxr is missing
                             old_indices = np.arange(len(audio_np))
                             new_length = int(len(audio_np) * resample_ratio)
                             new_indices = np.linspace(0, len(audio_np) - 1, new_length)
@@ -918,15 +967,28 @@ class GeminiLiveAvatarApp:
                             ).astype(np.int16)
 
                         # Push to bitHuman runtime
-                        await self.bithuman_runtime.push_audio(
-                            audio_np.tobytes(),
-                            GEMINI_INPUT_SAMPLE_RATE,
-                            last_chunk=False,
-                        )
+                        if len(audio_np):
+                            await self.bithuman_runtime.push_audio(
+                                audio_np.tobytes(),
+                                GEMINI_INPUT_SAMPLE_RATE,
+                                last_chunk=False,
+                            )
 
                     # Handle transcription
                     if transcription:
                         if transcription == "[TURN_COMPLETE]":
+                            # Drain the resampler's tail before ending the turn
+                            if self._resample_stream is not None:
+                                tail = self._resample_stream.resample_chunk(
+                                    np.zeros(0, dtype=np.int16), last=True
+                                )
+                                self._resample_stream = None
+                                if len(tail):
+                                    await self.bithuman_runtime.push_audio(
+                                        tail.tobytes(),
+                                        GEMINI_INPUT_SAMPLE_RATE,
+                                        last_chunk=False,
+                                    )
                             # End of Gemini response, flush bitHuman
                             await self.bithuman_runtime.flush()
                         elif transcription.startswith("[USER]:"):
@@ -970,7 +1032,16 @@ class GeminiLiveAvatarApp:
             if not self._running:
                 break
             try:
-                await self.gemini_session.send_audio(chunk.data, chunk.sample_rate)
+                audio_bytes = chunk.data
+                if chunk.channels > 1:
+                    # Gemini takes mono PCM; average interleaved int16 channels
+                    # in int32 so the mix can't overflow or upcast to float
+                    samples = np.frombuffer(audio_bytes, dtype=np.int16)
+                    frames = samples[: len(samples) // chunk.channels * chunk.channels]
+                    frames = frames.reshape(-1, chunk.channels)
+                    mono = frames.sum(axis=1, dtype=np.int32) // chunk.channels
+                    audio_bytes = mono.astype(np.int16).tobytes()
+                await self.gemini_session.send_audio(audio_bytes, chunk.sample_rate)
             except Exception as e:
                 logger.error(f"Error sending WebSocket audio to Gemini: {e}")
 
@@ -1043,6 +1114,7 @@ class GeminiLiveAvatarApp:
                     if push_audio_task and not push_audio_task.done():
                         push_audio_task.cancel()
                     self.bithuman_runtime.interrupt()
+                    self._resample_stream = None
                     if self.audio_player:
                         self.audio_player.clear()
                     if self.gemini_session:
@@ -1227,6 +1299,12 @@ if __name__ == "__main__":
         action="store_true",
         help="Enable local video display even in server mode",
     )
+    parser.add_argument(
+        "--rt-priority",
+        type=int,
+        default=0,
+        help="Run with SCHED_FIFO realtime priority 1-99 (Linux, optional)",
+    )
 
     args = parser.parse_args()
 
@@ -1250,7 +1328,13 @@ if __name__ == "__main__":
         )
         sys.exit(1)
 
+    if args.rt_priority > 0:
+        set_realtime_priority(args.rt_priority)
+
     try:
-        asyncio.run(main(args))
+        if uvloop is not None and hasattr(uvloop, "run"):
+            uvloop.run(main(args))
+        else:
+            asyncio.run(main(args))
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
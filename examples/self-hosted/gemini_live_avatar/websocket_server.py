@@ -28,6 +28,7 @@ import base64
 import json
 import struct
 import time
+from collections import deque
 from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
 from typing import Any, Optional
@@ -43,6 +44,34 @@ except ImportError:
     logger.error("websockets is not installed. Please run: pip install websockets")
     websockets = None
 
+# orjson is optional; it parses and serializes control messages faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(message: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+def _json_dumps(data: dict) -> str:
+    # Decode so clients keep receiving JSON as text frames
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:
+            # orjson is stricter than json (e.g. non-str keys, int subclasses)
+            pass
+    return json.dumps(data)
+
+
+# Binary media headers, network byte order
+_VIDEO_HEADER = struct.Struct("!BHHfId")
+_AUDIO_HEADER = struct.Struct("!BIBId")
+
 
 # Message types for the WebSocket protocol
 class MessageType:
@@ -90,6 +119,7 @@ class ClientConnection:
     last_activity: float
     subscribed_video: bool = True
     subscribed_audio: bool = True
+    send_errors: int = 0
 
 
 class MediaWebSocketServer:
@@ -103,6 +133,9 @@ class MediaWebSocketServer:
     - Support control messages (interrupt, gestures, etc.)
     """
 
+    # Per-frame failures repeat at frame rate; log the first and every Nth
+    ERROR_LOG_INTERVAL = 100
+
     def __init__(
         self,
         host: str = "0.0.0.0",
@@ -127,10 +160,7 @@ class MediaWebSocketServer:
         # Server state
         self._server = None
         self._running = False
-
-        # Output queues for each client
-        self._video_queues: dict[str, asyncio.Queue] = {}
-        self._audio_queues: dict[str, asyncio.Queue] = {}
+        self._audio_callback_errors = 0
 
     def set_audio_callback(self, callback: Callable[[AudioChunk, str], None]) -> None:
         """Set callback for received audio input."""
@@ -156,6 +186,10 @@ class MediaWebSocketServer:
             self.port,
             ping_interval=30,
             ping_timeout=10,
+            # Media is already compressed (JPEG) or incompressible (PCM), so
+            # permessage-deflate only burns CPU; allow audio clips up to 4 MiB
+            compression=None,
+            max_size=2**22,
         )
         logger.info(f"WebSocket server started at ws://{self.host}:{self.port}")
 
@@ -199,13 +233,14 @@ class MediaWebSocketServer:
             fps=fps,
         )
 
-        # Send to all subscribed clients
-        for client_id, client in list(self.clients.items()):
+        # Frame the message once and send the same bytes to every client
+        message = self._pack_video_frame(video_frame)
+        for client in list(self.clients.values()):
             if client.subscribed_video:
                 try:
-                    await self._send_video_frame(client.websocket, video_frame)
+                    await client.websocket.send(message)
                 except Exception as e:
-                    logger.warning(f"Failed to send video to {client_id}: {e}")
+                    self._log_send_error(client, "video", e)
 
     async def broadcast_audio_chunk(
         self,
@@ -220,7 +255,10 @@ class MediaWebSocketServer:
         # Convert numpy array to bytes if needed
         if isinstance(audio_data, np.ndarray):
             if audio_data.dtype == np.float32:
-                audio_data = (audio_data * 32768).astype(np.int16)
+                # Saturate so samples at or above 1.0 don't wrap negative
+                scaled = np.multiply(audio_data, 32767.0)
+                np.clip(scaled, -32768.0, 32767.0, out=scaled)
+                audio_data = scaled.astype(np.int16)
             audio_data = audio_data.tobytes()
 
         audio_chunk = AudioChunk(
@@ -229,13 +267,14 @@ class MediaWebSocketServer:
             timestamp=timestamp or time.time(),
         )
 
-        # Send to all subscribed clients
-        for client_id, client in list(self.clients.items()):
+        # Frame the message once and send the same bytes to every client
+        message = self._pack_audio_chunk(audio_chunk)
+        for client in list(self.clients.values()):
             if client.subscribed_audio:
                 try:
-                    await self._send_audio_chunk(client.websocket, audio_chunk)
+                    await client.websocket.send(message)
                 except Exception as e:
-                    logger.warning(f"Failed to send audio to {client_id}: {e}")
+                    self._log_send_error(client, "audio", e)
 
     async def send_transcription(
         self, text: str, is_final: bool = True, role: str = "assistant"
@@ -283,8 +322,6 @@ class MediaWebSocketServer:
             last_activity=time.time(),
         )
         self.clients[client_id] = client
-        self._video_queues[client_id] = asyncio.Queue(maxsize=30)
-        self._audio_queues[client_id] = asyncio.Queue(maxsize=100)
 
         logger.info(f"Client {client_id} connected from {websocket.remote_address}")
 
@@ -312,8 +349,6 @@ class MediaWebSocketServer:
         finally:
             # Cleanup
             del self.clients[client_id]
-            del self._video_queues[client_id]
-            del self._audio_queues[client_id]
             logger.info(f"Client {client_id} cleaned up")
 
     async def _process_message(self, client_id: str, message: bytes | str) -> None:
@@ -321,7 +356,7 @@ class MediaWebSocketServer:
         try:
             # Parse JSON message
             if isinstance(message, str):
-                data = json.loads(message)
+                data = _json_loads(message)
             else:
                 # Binary message - could be raw audio
                 data = {"type": MessageType.AUDIO_INPUT, "raw_data": message}
@@ -353,11 +388,38 @@ class MediaWebSocketServer:
             audio_b64 = data.get("data", "")
             audio_bytes = base64.b64decode(audio_b64)
             sample_rate = data.get("sample_rate", 16000)
+        channels = data.get("channels", 1)
+
+        # Downstream buffering divides by both; reject the chunk up front
+        if not (
+            isinstance(sample_rate, int)
+            and sample_rate > 0
+            and isinstance(channels, int)
+            and channels > 0
+        ):
+            logger.warning(
+                f"Rejected audio from {client_id}: "
+                f"sample_rate={sample_rate!r}, channels={channels!r}"
+            )
+            client = self.clients.get(client_id)
+            if client:
+                await self._send_json(
+                    client.websocket,
+                    {
+                        "type": MessageType.ERROR,
+                        "data": {
+                            "error": "sample_rate and channels must be positive "
+                            "integers",
+                            "timestamp": time.time(),
+                        },
+                    },
+                )
+            return
 
         audio_chunk = AudioChunk(
             data=audio_bytes,
             sample_rate=sample_rate,
-            channels=data.get("channels", 1),
+            channels=channels,
             timestamp=data.get("timestamp", time.time()),
         )
 
@@ -367,8 +429,13 @@ class MediaWebSocketServer:
                 result = self._on_audio_input(audio_chunk, client_id)
                 if asyncio.iscoroutine(result):
                     await result
-            except Exception as e:
-                logger.error(f"Error in audio callback: {e}")
+            except Exception:
+                self._audio_callback_errors += 1
+                if self._audio_callback_errors % self.ERROR_LOG_INTERVAL == 1:
+                    logger.opt(exception=True).error(
+                        "Error in audio callback ({} so far)",
+                        self._audio_callback_errors,
+                    )
 
     async def _handle_text_input(self, client_id: str, data: dict) -> None:
         """Handle text input from client."""
@@ -409,53 +476,56 @@ class MediaWebSocketServer:
             except Exception as e:
                 logger.error(f"Error in control callback: {e}")
 
-    async def _send_video_frame(
-        self, websocket: WebSocketServerProtocol, frame: VideoFrame
-    ) -> None:
-        """Send video frame to a client."""
-        # Pack header: type(1) + width(2) + height(2) + fps(4) + timestamp(8) + len(4)
-        header = struct.pack(
-            "!BHHFI",
+    @staticmethod
+    def _pack_video_frame(frame: VideoFrame) -> bytes:
+        """Frame a video message for sending."""
+        # Header: type(1) + width(2) + height(2) + fps(4) + len(4) + timestamp(8)
+        header = _VIDEO_HEADER.pack(
             0x01,  # Video frame type
             frame.width,
             frame.height,
             frame.fps,
             len(frame.data),
+            frame.timestamp,
         )
-        # Also send timestamp as double
-        timestamp_bytes = struct.pack("!d", frame.timestamp)
-
-        await websocket.send(header + timestamp_bytes + frame.data)
+        return b"".join((header, frame.data))
 
-    async def _send_audio_chunk(
-        self, websocket: WebSocketServerProtocol, chunk: AudioChunk
-    ) -> None:
-        """Send audio chunk to a client."""
-        # Pack header: type(1) + sample_rate(4) + channels(1) + data_len(4)
-        header = struct.pack(
-            "!BIBI",
+    @staticmethod
+    def _pack_audio_chunk(chunk: AudioChunk) -> bytes:
+        """Frame an audio message for sending."""
+        # Header: type(1) + sample_rate(4) + channels(1) + len(4) + timestamp(8)
+        header = _AUDIO_HEADER.pack(
             0x02,  # Audio chunk type
             chunk.sample_rate,
             chunk.channels,
             len(chunk.data),
+            chunk.timestamp,
         )
-        # Also send timestamp as double
-        timestamp_bytes = struct.pack("!d", chunk.timestamp)
+        return b"".join((header, chunk.data))
 
-        await websocket.send(header + timestamp_bytes + chunk.data)
+    def _log_send_error(
+        self, client: ClientConnection, kind: str, error: Exception
+    ) -> None:
+        """Log a failed send, sampled so a dead client doesn't flood the log."""
+        client.send_errors += 1
+        if client.send_errors % self.ERROR_LOG_INTERVAL == 1:
+            logger.warning(
+                f"Failed to send {kind} to {client.client_id} "
+                f"({client.send_errors} failures): {error}"
+            )
 
     async def _send_json(self, websocket: WebSocketServerProtocol, data: dict) -> None:
         """Send JSON message to a client."""
-        await websocket.send(json.dumps(data))
+        await websocket.send(_json_dumps(data))
 
     async def _broadcast_json(self, data: dict) -> None:
         """Broadcast JSON message to all clients."""
-        message = json.dumps(data)
-        for client_id, client in list(self.clients.items()):
+        message = _json_dumps(data)
+        for client in list(self.clients.values()):
             try:
                 await client.websocket.send(message)
             except Exception as e:
-                logger.warning(f"Failed to send to {client_id}: {e}")
+                self._log_send_error(client, "message", e)
 
     @property
     def client_count(self) -> int:
@@ -474,11 +544,20 @@ class WebSocketAudioInput:
     Collects audio from connected clients and provides it as an async iterator.
     """
 
-    def __init__(self, sample_rate: int = 16000):
+    def __init__(self, sample_rate: int = 16000, max_buffer_ms: float = 500.0):
         self.sample_rate = sample_rate
-        self._queue: asyncio.Queue[AudioChunk] = asyncio.Queue(maxsize=100)
+        self.max_buffer_ms = max_buffer_ms
+        # The event wakes the consumer without a Future allocation per chunk
+        self._buffer: deque[AudioChunk] = deque()
+        self._buffered_ms = 0.0
+        self._dropped_chunks = 0
+        self._ready = asyncio.Event()
         self._running = False
 
+    @staticmethod
+    def _duration_ms(chunk: AudioChunk) -> float:
+        return len(chunk.data) * 500.0 / (chunk.sample_rate * chunk.channels)
+
     def start(self) -> None:
         """Start the audio input."""
         self._running = True
@@ -486,34 +565,49 @@ class WebSocketAudioInput:
     def stop(self) -> None:
         """Stop the audio input."""
         self._running = False
-        # Clear queue
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self._buffer.clear()
+        self._buffered_ms = 0.0
+        # Wake any pending reader so iteration can exit
+        self._ready.set()
 
     async def push_audio(self, chunk: AudioChunk, client_id: str) -> None:
         """Push audio chunk from WebSocket callback."""
         if not self._running:
             return
 
-        try:
-            self._queue.put_nowait(chunk)
-        except asyncio.QueueFull:
-            # Drop oldest
-            try:
-                self._queue.get_nowait()
-                self._queue.put_nowait(chunk)
-            except asyncio.QueueEmpty:
-                pass
+        # Compute the duration first so a bad chunk never reaches the buffer
+        duration_ms = self._duration_ms(chunk)
+        self._buffer.append(chunk)
+        self._buffered_ms += duration_ms
+
+        # Drop the oldest audio once the backlog exceeds max_buffer_ms so a
+        # network stall doesn't turn into permanent conversational latency
+        while self._buffered_ms > self.max_buffer_ms and len(self._buffer) > 1:
+            self._buffered_ms -= self._duration_ms(self._buffer.popleft())
+            self._dropped_chunks += 1
+            if self._dropped_chunks % 50 == 1:
+                logger.warning(
+                    f"Audio input backlog over {self.max_buffer_ms:.0f}ms, "
+                    f"dropped {self._dropped_chunks} chunks so far"
+                )
+        self._ready.set()
 
     async def get_chunk(self, timeout: float = 1.0) -> Optional[AudioChunk]:
         """Get next audio chunk."""
-        try:
-            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
-        except asyncio.TimeoutError:
-            return None
+        if not self._buffer:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+            if not self._buffer:
+                return None
+        chunk = self._buffer.popleft()
+        if self._buffer:
+            self._buffered_ms -= self._duration_ms(chunk)
+        else:
+            self._buffered_ms = 0.0
+        return chunk
 
     async def __aiter__(self) -> AsyncIterator[AudioChunk]:
         """Async iterator for audio chunks."""
@@ -43,14 +43,22 @@ Usage:
 
 import argparse
 import asyncio
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import aiohttp
 import cv2
 import numpy as np
 from dotenv import load_dotenv
+from livekit.rtc import AudioResampler, AudioResamplerQuality
 
 # Pipecat imports
 from pipecat.frames.frames import (
@@ -63,7 +71,6 @@ from pipecat.frames.frames import (
     OutputImageRawFrame,
     StartFrame,
     StartInterruptionFrame,
-    SystemFrame,
     TextFrame,
     TranscriptionFrame,
     TTSAudioRawFrame,
@@ -78,24 +85,103 @@ from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.services.deepgram import DeepgramSTTService
 from pipecat.services.openai import OpenAILLMService, OpenAITTSService
 from pipecat.transports.services.daily import DailyParams, DailyTransport
-from scipy import signal
 
 # BitHuman imports
 from bithuman import AsyncBithuman
 
-# Configure logging
+# uvloop is optional and not available on Windows; fall back to asyncio's loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Configure logging. Records are handed to a queue and written by a listener
+# thread, so logging from the render loop never blocks the event loop on I/O.
 logger = logging.getLogger("bithuman-pipecat-daily-agent")
 logger.setLevel(logging.INFO)
 handler = logging.StreamHandler()
 handler.setFormatter(
     logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
-logger.addHandler(handler)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+# The root handler set up by basicConfig() in __main__ would print every record a
+# second time, synchronously on the event loop thread
+logger.propagate = False
+_log_listener = logging.handlers.QueueListener(_log_queue, handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush queued records on exit
 
 # Load environment variables
 load_dotenv()
 
 
+def _make_silence(sample_rate: int, duration_ms: int) -> bytes:
+    """Return duration_ms of int16 mono silence at the given sample rate."""
+    return bytes(sample_rate * duration_ms // 1000 * 2)
+
+
+def _pcm16_duration_ns(num_bytes: int, sample_rate: int) -> int:
+    """Return the duration of int16 mono PCM in integer nanoseconds."""
+    return num_bytes // 2 * 1_000_000_000 // sample_rate
+
+
+def _new_resampler(input_sample_rate: int, target_sample_rate: int) -> AudioResampler:
+    """Create a streaming int16 mono resampler between two rates.
+
+    Resampling stays on the CPU even when the avatar runs on a GPU: TTS chunks
+    are a few hundred int16 samples, so a device round trip per chunk would cost
+    more than the resample itself.
+    """
+    return AudioResampler(
+        input_sample_rate,
+        target_sample_rate,
+        num_channels=1,
+        quality=AudioResamplerQuality.MEDIUM,
+    )
+
+
+def _int16_array(audio: np.ndarray) -> np.ndarray:
+    """Convert a numpy audio array to int16 PCM samples for BitHuman."""
+    if audio.dtype != np.int16:
+        # Convert float32 to int16 if needed
+        if audio.dtype == np.float32:
+            # Clamp values to [-1, 1] range before conversion
+            audio = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+            logger.debug("🔄 Converted float32 audio to int16 (shape: %s)", audio.shape)
+        else:
+            logger.debug("🔄 Converted %s audio to int16", audio.dtype)
+            audio = audio.astype(np.int16)
+    return audio
+
+
+def _int16_bytes_from_array(audio: np.ndarray) -> bytes:
+    """Convert a numpy audio array to int16 PCM bytes for BitHuman."""
+    return _int16_array(audio).tobytes()
+
+
+def _int16_bytearray_from_array(audio: np.ndarray) -> bytearray:
+    """Convert a numpy audio array to an int16 PCM bytearray for the resampler."""
+    return bytearray(_int16_array(audio))
+
+
+# Decoders for TTS audio payloads, keyed on the exact payload type. One is picked
+# per TTS stream, so chunks don't go through any type checks. bytes(b) returns b
+# itself for a bytes payload, so the common case copies nothing.
+_AUDIO_BYTES_DECODERS: dict[type, Callable] = {
+    bytes: bytes,
+    memoryview: bytes,
+    np.ndarray: _int16_bytes_from_array,
+}
+# The resampler reads from a writable buffer, so payloads are decoded straight
+# into a bytearray when resampling
+_AUDIO_BYTEARRAY_DECODERS: dict[type, Callable] = {
+    bytes: bytearray,
+    memoryview: bytearray,
+    np.ndarray: _int16_bytearray_from_array,
+}
+
+
 class BitHumanAvatarProcessor(FrameProcessor):
     """
     Pipecat FrameProcessor that integrates BitHuman avatar rendering.
@@ -104,12 +190,39 @@ class BitHumanAvatarProcessor(FrameProcessor):
     and outputs synchronized video and audio frames for the avatar.
     """
 
+    # Log audio progress once per this many output audio chunks (~1s at 25fps)
+    _AUDIO_PROGRESS_LOG_STRIDE = 25
+    # Number of recent audio chunk sizes kept for the final summary (power of two,
+    # so the ring-buffer index wraps with a mask)
+    _AUDIO_CHUNK_HISTORY = 4096
+    # Output frames queued between the render loop and push_frame. Video drops
+    # the oldest frame when full; audio is never dropped and applies backpressure.
+    _VIDEO_QUEUE_SIZE = 3
+    _AUDIO_QUEUE_SIZE = 8
+    # Speech video frames rendered further than this behind real-time playback of
+    # the segment's audio are dropped (skipping their color conversion) so the
+    # render loop can catch up. Past the resync limit the audio has stalled too,
+    # so the segment clock is re-anchored instead of dropping every later frame.
+    _LATE_VIDEO_TOLERANCE_NS = 50_000_000
+    _LATE_VIDEO_RESYNC_NS = 500_000_000
+    # TTS audio is coalesced into pushes of at least this many milliseconds
+    _TTS_BATCH_MS = 40
+    # Errors logged with a full traceback per call site; after that only every
+    # Nth repeat carries one and the rest log the error itself
+    _MAX_TRACEBACK_LOGS = 3
+    _TRACEBACK_SAMPLE_EVERY = 100
+    # Silence pushed once at startup to kick off video generation; one 20ms TTS
+    # frame's worth is enough, and longer primes only delay the first real audio
+    _INITIAL_SILENCE_MS = 20
+
     def __init__(
         self,
         model_path: str,
         api_secret: str,
         video_fps: int = 25,
         flush_delay: float = 0.5,
+        video_color_format: str = "RGB",
+        audio_batch_duration: float = 0.0,
         **kwargs,
     ):
         """
@@ -122,16 +235,40 @@ class BitHumanAvatarProcessor(FrameProcessor):
             flush_delay: Delay in seconds before flushing runtime after TTSStoppedFrame (default: 0.5)
                          This ensures all TTS audio frames arrive before signaling end_of_speech.
                          Increase this value if you experience premature lip-sync ending.
+            video_color_format: Color format of output video frames, "RGB" or "BGR"
+                         (default: "RGB"). "BGR" passes the runtime's images through
+                         without a per-frame color conversion; only use it when the
+                         output transport is configured for BGR input as well.
+            audio_batch_duration: Seconds of runtime audio to coalesce into one
+                         output audio frame (default: 0.0, one frame per chunk).
+                         Batching cuts push_frame calls but delays audio by up
+                         to this amount relative to the video; keep it well
+                         under the lip-sync budget, e.g. 0.08.
         """
         super().__init__(**kwargs)
         self._model_path = model_path
         self._api_secret = api_secret
         self._video_fps = video_fps
+        if video_color_format not in ("RGB", "BGR"):
+            raise ValueError(
+                f"video_color_format must be 'RGB' or 'BGR', got {video_color_format!r}"
+            )
+        self._video_color_format = video_color_format
+        self._audio_batch_duration = audio_batch_duration
         self._runtime: Optional[AsyncBithuman] = None
         self._render_task: Optional[asyncio.Task] = None
+        # Worker thread for the per-frame BGR->RGB conversion (OpenCV releases
+        # the GIL), so it doesn't run on the event loop
+        self._cv_executor: ThreadPoolExecutor | None = None
         self._running = False
         self._frame_size: tuple[int, int] = (512, 512)  # Default, updated on start
         self._sample_rate: int = 16000
+        # Reusable silence payloads, rebuilt once the runtime sample rate is known
+        self._silence_10ms: bytes = _make_silence(self._sample_rate, 10)
+        self._initial_silence: bytes = _make_silence(
+            self._sample_rate, self._INITIAL_SILENCE_MS
+        )
+        self._empty_last_chunk_supported: bool = True
         self._last_tts_stop_time: Optional[float] = None
         self._flush_task: Optional[asyncio.Task] = None
         self._tts_active: bool = False  # Track if TTS is currently active
@@ -142,16 +279,59 @@ class BitHumanAvatarProcessor(FrameProcessor):
             flush_delay  # Fallback delay if duration-based detection fails
         )
 
-        # Audio duration tracking for precise completion detection
-        self._input_audio_duration: float = (
-            0.0  # Total duration of TTS audio pushed to runtime
-        )
-        self._output_audio_duration: float = (
-            0.0  # Total duration of audio output from runtime
+        # Audio duration tracking for precise completion detection, in integer
+        # nanoseconds so long sessions accumulate without float rounding drift
+        self._input_audio_duration_ns: int = 0  # TTS audio pushed to runtime
+        self._output_audio_duration_ns: int = 0  # Audio output from runtime
+        # Set by the render loop whenever _output_audio_duration_ns advances, so
+        # _smart_flush can wake on progress instead of polling
+        self._output_progress_event = asyncio.Event()
+        # Set once the runtime is created, started and the render loop is running
+        self._ready = asyncio.Event()
+
+        self._video_size: tuple[int, int] | None = None  # (width, height)
+
+        # Audio push statistics: total count plus sizes of the most recent chunks
+        self._audio_chunk_push_count: int = 0
+        self._audio_chunk_sizes = np.zeros(self._AUDIO_CHUNK_HISTORY, dtype=np.int32)
+        # (input_rate, target_rate, payload_type, decoder, resampler or None) for
+        # the current TTS stream; rebuilt when any of the first three changes,
+        # with a fresh resampler per segment
+        self._resample_state: (
+            tuple[int, int, type, Callable, AudioResampler | None] | None
+        ) = None
+        self._last_missing_runtime_log: float = float("-inf")
+        # TTS audio (int16 at the runtime rate) not yet pushed to the runtime
+        self._tts_batch = bytearray()
+        # Scratch buffers for float audio chunks coming back from the runtime,
+        # grown on demand
+        self._render_scratch_f32 = np.empty(0, dtype=np.float32)
+        self._render_scratch_i16 = np.empty(0, dtype=np.int16)
+        self._video_without_audio_count: int = 0
+        self._dropped_video_count: int = 0
+        # Output frames wait here, tagged with the output generation, until the
+        # push tasks hand them downstream. An interruption bumps the generation
+        # and empties the queues so no frame of the interrupted speech follows
+        # it to the transport.
+        self._video_queue: asyncio.Queue[tuple[int, Frame]] = asyncio.Queue(
+            maxsize=self._VIDEO_QUEUE_SIZE
         )
-        self._tts_segment_start_time: Optional[float] = (
-            None  # When current TTS segment started
+        self._audio_queue: asyncio.Queue[tuple[int, Frame]] = asyncio.Queue(
+            maxsize=self._AUDIO_QUEUE_SIZE
         )
+        self._output_generation: int = 0
+        # Wall-clock start (monotonic ns) of the current run of segment audio,
+        # set by the render loop on the first speech frame after a reset or gap
+        self._segment_clock_start_ns: int | None = None
+        self._late_video_count: int = 0
+
+        # Frame counters and first-seen frame types for diagnostics
+        self._tts_audio_frame_count: int = 0
+        self._audio_raw_frame_count: int = 0
+        self._all_frames_logged: set[str] = set()
+        self._frame_types_seen: set[str] = set()
+        # Errors seen per _log_error message, for traceback sampling
+        self._error_log_counts: dict[str, int] = {}
 
     async def _initialize_runtime(self):
         """Initialize the BitHuman runtime (can be called from start() or lazily)."""
@@ -185,6 +365,10 @@ class BitHumanAvatarProcessor(FrameProcessor):
                 self._sample_rate = getattr(
                     self._runtime.settings, "INPUT_SAMPLE_RATE", 16000
                 )
+            self._silence_10ms = _make_silence(self._sample_rate, 10)
+            self._initial_silence = _make_silence(
+                self._sample_rate, self._INITIAL_SILENCE_MS
+            )
             logger.info(f"🔊 Audio sample rate: {self._sample_rate}")
 
             # Start the runtime (reference: example.py line 208)
@@ -196,6 +380,10 @@ class BitHumanAvatarProcessor(FrameProcessor):
             # Start the render loop AFTER runtime.start()
             # Reference: example.py - runtime.start() is called before runtime.run()
             self._running = True
+            if self._video_color_format == "RGB" and self._cv_executor is None:
+                self._cv_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="bh-cv"
+                )
             self._render_task = asyncio.create_task(self._render_loop())
             logger.info("🎬 BitHuman render loop started")
 
@@ -203,13 +391,11 @@ class BitHumanAvatarProcessor(FrameProcessor):
             # This ensures video frames are generated even before TTS audio arrives
             await self._push_initial_silence()
 
+            self._ready.set()
             logger.info("✅ BitHuman runtime fully initialized and ready for TTS audio")
 
         except Exception as e:
-            logger.error(f"❌ Failed to initialize BitHuman runtime: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ Failed to initialize BitHuman runtime: {e}")
             raise
 
     async def start(self, frame: StartFrame):
@@ -229,12 +415,9 @@ class BitHumanAvatarProcessor(FrameProcessor):
             return
 
         try:
-            # Push 100ms of silence (1600 samples at 16kHz)
-            silence_samples = 1600
-            silence_bytes = b"\x00" * (silence_samples * 2)  # 16-bit samples
-
+            # Push a short prime of silence at the runtime sample rate
             await self._runtime.push_audio(
-                silence_bytes,
+                self._initial_silence,
                 sample_rate=self._sample_rate,
                 last_chunk=False,
             )
@@ -248,12 +431,7 @@ class BitHumanAvatarProcessor(FrameProcessor):
         self._running = False
 
         # Cancel pending flush task
-        if self._flush_task and not self._flush_task.done():
-            self._flush_task.cancel()
-            try:
-                await self._flush_task
-            except asyncio.CancelledError:
-                pass
+        await self._cancel_flush_task()
 
         if self._render_task:
             self._render_task.cancel()
@@ -262,6 +440,10 @@ class BitHumanAvatarProcessor(FrameProcessor):
             except asyncio.CancelledError:
                 pass
 
+        if self._cv_executor:
+            self._cv_executor.shutdown(wait=False)
+            self._cv_executor = None
+
         if self._runtime:
             # Flush before stopping to ensure all audio is processed
             await self._runtime.flush()
@@ -272,13 +454,53 @@ class BitHumanAvatarProcessor(FrameProcessor):
 
     async def cancel(self, frame: CancelFrame):
         """Handle cancellation (interruption)."""
-        if self._runtime:
-            self._runtime.interrupt()
-            # Flush on cancellation to clear the buffer
-            await self._runtime.flush()
-            logger.debug("BitHuman runtime interrupted and flushed")
+        await self._reset_tts_state(interrupt_runtime=True)
+        logger.debug("BitHuman runtime interrupted and flushed")
         await super().cancel(frame)
 
+    async def _cancel_flush_task(self) -> bool:
+        """
+        Cancel the pending smart flush, if any, and wait for it to finish.
+
+        Returns True if a flush was pending.
+        """
+        if not self._flush_task or self._flush_task.done():
+            return False
+        self._flush_task.cancel()
+        try:
+            await self._flush_task
+        except asyncio.CancelledError:
+            pass
+        return True
+
+    async def _reset_tts_state(self, interrupt_runtime: bool = False):
+        """
+        Reset per-segment TTS tracking before new speech or after an interruption.
+
+        With interrupt_runtime, audio not yet spoken is discarded as well: the
+        pending TTS batch and resampler state here, and the runtime's buffer.
+        """
+        await self._cancel_flush_task()
+        self._last_tts_stop_time = None
+        self._last_audio_frame_time = None
+        self._input_audio_duration_ns = 0
+        self._output_audio_duration_ns = 0
+        self._segment_clock_start_ns = None
+        if interrupt_runtime:
+            self._tts_batch.clear()
+            self._flush_resampler()
+            self._output_generation += 1
+            self._drain_output_queues()
+            if self._runtime:
+                self._runtime.interrupt()
+                await self._runtime.flush()
+
+    def _drain_output_queues(self) -> None:
+        """Discard rendered frames that have not been pushed downstream yet."""
+        for output_queue in (self._video_queue, self._audio_queue):
+            while not output_queue.empty():
+                output_queue.get_nowait()
+
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         """Process incoming frames."""
         # CRITICAL: Handle TTS audio frames FIRST - before any other processing
@@ -325,8 +547,6 @@ class BitHumanAvatarProcessor(FrameProcessor):
                 )
 
                 # Track TTS audio frames for monitoring
-                if not hasattr(self, "_tts_audio_frame_count"):
-                    self._tts_audio_frame_count = 0
                 self._tts_audio_frame_count += 1
 
                 # CRITICAL: Always use last_chunk=False for streaming audio frames
@@ -361,9 +581,7 @@ class BitHumanAvatarProcessor(FrameProcessor):
                 )
 
                 # Update last audio frame time - this helps us know when all audio has arrived
-                import time
-
-                self._last_audio_frame_time = time.time()
+                self._last_audio_frame_time = time.monotonic()
 
                 # Calculate and track input audio duration
                 # For int16 audio: duration = len(bytes) / 2 / sample_rate
@@ -375,22 +593,22 @@ class BitHumanAvatarProcessor(FrameProcessor):
                     else b""
                 )
                 if audio_bytes:
-                    audio_duration = (
-                        len(audio_bytes) / 2 / frame.sample_rate
-                    )  # int16 = 2 bytes per sample
-                    self._input_audio_duration += audio_duration
+                    audio_duration_ns = _pcm16_duration_ns(
+                        len(audio_bytes), frame.sample_rate
+                    )
+                    input_duration_ns = (
+                        self._input_audio_duration_ns + audio_duration_ns
+                    )
+                    self._input_audio_duration_ns = input_duration_ns
                     logger.debug(
-                        f"📊 Input audio duration: {self._input_audio_duration:.3f}s "
-                        f"(added {audio_duration:.3f}s from {len(audio_bytes)} bytes)"
+                        "📊 Input audio duration: %.3fs (added %.3fs from %d bytes)",
+                        input_duration_ns / 1e9,
+                        audio_duration_ns / 1e9,
+                        len(audio_bytes),
                     )
 
                 # Cancel any pending flush task - new audio is arriving
-                if self._flush_task and not self._flush_task.done():
-                    self._flush_task.cancel()
-                    try:
-                        await self._flush_task
-                    except asyncio.CancelledError:
-                        pass
+                if await self._cancel_flush_task():
                     logger.debug("🔄 Cancelled pending flush - new TTS audio arrived")
 
                 # Push audio to runtime - this is critical for lip-sync
@@ -404,7 +622,7 @@ class BitHumanAvatarProcessor(FrameProcessor):
                 ):
                     logger.info(
                         f"✅ Processed TTS audio frame #{self._tts_audio_frame_count} "
-                        f"(total input duration: {self._input_audio_duration:.3f}s)"
+                        f"(total input duration: {self._input_audio_duration_ns / 1e9:.3f}s)"
                     )
             else:
                 logger.warning("⚠️  Received TTS audio but runtime not ready")
@@ -415,8 +633,6 @@ class BitHumanAvatarProcessor(FrameProcessor):
         # NOTE: This logging happens AFTER TTSAudioRawFrame check, so we can see what other frames arrive
         # Use the frame_type_name we already computed above to avoid recomputing
         frame_type = frame_type_name  # Reuse the variable from TTSAudioRawFrame check above (line 263)
-        if not hasattr(self, "_all_frames_logged"):
-            self._all_frames_logged = set()
         if frame_type not in self._all_frames_logged:
             logger.info(
                 f"🔍🔍🔍 ALL FRAMES: First time seeing {frame_type} - checking if it has audio attributes..."
@@ -463,8 +679,6 @@ class BitHumanAvatarProcessor(FrameProcessor):
             frame_type_name = type(frame).__name__
 
             # Count how many AudioRawFrame we receive to track if user is speaking
-            if not hasattr(self, "_audio_raw_frame_count"):
-                self._audio_raw_frame_count = 0
             self._audio_raw_frame_count += 1
 
             # Log first occurrence and every 100th frame to track audio flow
@@ -513,7 +727,7 @@ class BitHumanAvatarProcessor(FrameProcessor):
         if isinstance(frame, OutputAudioRawFrame):
             # Check if this is from TTS (it should be if it's coming from tts service in pipeline)
             # We can identify TTS audio by checking if TTS is active
-            if hasattr(self, "_tts_active") and self._tts_active:
+            if self._tts_active:
                 logger.info(
                     f"🎵🎵🎵 TTS AUDIO FRAME RECEIVED (OutputAudioRawFrame)! sample_rate={frame.sample_rate}, audio_type={type(frame.audio).__name__}"
                 )
@@ -534,9 +748,7 @@ class BitHumanAvatarProcessor(FrameProcessor):
                     )
 
                     # Update last audio frame time - this helps us know when all audio has arrived
-                    import time
-
-                    self._last_audio_frame_time = time.time()
+                    self._last_audio_frame_time = time.monotonic()
 
                     # Calculate and track input audio duration
                     audio_bytes = (
@@ -547,29 +759,27 @@ class BitHumanAvatarProcessor(FrameProcessor):
                         else b""
                     )
                     if audio_bytes:
-                        audio_duration = (
-                            len(audio_bytes) / 2 / frame.sample_rate
-                        )  # int16 = 2 bytes per sample
-                        self._input_audio_duration += audio_duration
+                        audio_duration_ns = _pcm16_duration_ns(
+                            len(audio_bytes), frame.sample_rate
+                        )
+                        input_duration_ns = (
+                            self._input_audio_duration_ns + audio_duration_ns
+                        )
+                        self._input_audio_duration_ns = input_duration_ns
                         logger.debug(
-                            f"📊 Input audio duration: {self._input_audio_duration:.3f}s "
-                            f"(added {audio_duration:.3f}s from OutputAudioRawFrame)"
+                            "📊 Input audio duration: %.3fs "
+                            "(added %.3fs from OutputAudioRawFrame)",
+                            input_duration_ns / 1e9,
+                            audio_duration_ns / 1e9,
                         )
 
                     # Cancel any pending flush task - new audio is arriving
-                    if self._flush_task and not self._flush_task.done():
-                        self._flush_task.cancel()
-                        try:
-                            await self._flush_task
-                        except asyncio.CancelledError:
-                            pass
+                    if await self._cancel_flush_task():
                         logger.debug(
                             "🔄 Cancelled pending flush - new TTS audio (OutputAudioRawFrame) arrived"
                         )
 
                     # Track TTS audio frames for monitoring
-                    if not hasattr(self, "_tts_audio_frame_count"):
-                        self._tts_audio_frame_count = 0
                     self._tts_audio_frame_count += 1
 
                     # Log ALL frames initially to debug
@@ -599,8 +809,6 @@ class BitHumanAvatarProcessor(FrameProcessor):
 
         # DEBUG: Log all frame types to understand what's arriving (after TTS check)
         frame_type = type(frame).__name__
-        if not hasattr(self, "_frame_types_seen"):
-            self._frame_types_seen = set()
         if frame_type not in self._frame_types_seen:
             logger.info(f"🔍 DEBUG: First time seeing frame type: {frame_type}")
             self._frame_types_seen.add(frame_type)
@@ -656,31 +864,15 @@ class BitHumanAvatarProcessor(FrameProcessor):
         # This ensures frames are properly processed by the framework
         await super().process_frame(frame, direction)
 
-        # Handle TTS lifecycle events - pass through
-        # NOTE: super().process_frame() already called above, so we just push downstream
+        # Handle TTS lifecycle events and interruptions, then fall through to the
+        # single push_frame() below; every other frame passes straight through
         if isinstance(frame, TTSStartedFrame):
             logger.info("🎤 TTS started")
             # Mark TTS as active
             self._tts_active = True
-            # Cancel any pending flush task - new TTS is starting
-            if self._flush_task and not self._flush_task.done():
-                self._flush_task.cancel()
-                try:
-                    await self._flush_task
-                except asyncio.CancelledError:
-                    pass
-            # Reset flush timer and audio frame tracking when new TTS starts
-            self._last_tts_stop_time = None
-            self._last_audio_frame_time = None
-            # Reset audio duration tracking for new TTS segment
-            self._input_audio_duration = 0.0
-            self._output_audio_duration = 0.0
-            import time
-
-            self._tts_segment_start_time = time.time()
-            # Already called super().process_frame() above, just push downstream
-            await self.push_frame(frame, direction)
-            return
+            # Cancel any pending flush task and reset duration tracking - new TTS
+            # is starting
+            await self._reset_tts_state()
 
         elif isinstance(frame, TTSStoppedFrame):
             logger.info("🎤 TTS stopped")
@@ -692,41 +884,37 @@ class BitHumanAvatarProcessor(FrameProcessor):
             # output_audio_duration (audio output from runtime). When they match,
             # we know all audio has been processed.
             if self._runtime:
-                import time
-
-                current_time = time.time()
-
                 logger.info(
-                    f"📊 TTSStoppedFrame received. Input audio duration: {self._input_audio_duration:.3f}s, "
-                    f"Output audio duration: {self._output_audio_duration:.3f}s"
+                    f"📊 TTSStoppedFrame received. Input audio duration: {self._input_audio_duration_ns / 1e9:.3f}s, "
+                    f"Output audio duration: {self._output_audio_duration_ns / 1e9:.3f}s"
                 )
 
                 # Cancel any existing flush task
-                if self._flush_task and not self._flush_task.done():
-                    self._flush_task.cancel()
-                    try:
-                        await self._flush_task
-                    except asyncio.CancelledError:
-                        pass
+                await self._cancel_flush_task()
 
                 # Schedule smart flush based on duration tracking
                 async def _smart_flush():
+                    monotonic = time.monotonic
                     try:
-                        # Wait a short time for any remaining TTS audio frames to arrive
-                        # This handles network delay between TTSStoppedFrame and last TTSAudioRawFrame
-                        initial_wait = 0.1  # 100ms initial wait
-                        await asyncio.sleep(initial_wait)
-
-                        # Check if new audio arrived during initial wait
+                        # Yield once so any already-queued TTS audio frames are pushed to
+                        # the runtime. Late frames don't need a fixed wait: they cancel
+                        # this task, and the progress wait below wakes as soon as output
+                        # arrives.
+                        await asyncio.sleep(0)
+                        # Hand any batched TTS audio to the runtime before waiting
+                        # for its output to catch up with the input
+                        await self._flush_tts_batch()
+
+                        # Check if new audio arrived just before TTSStoppedFrame
                         if self._last_audio_frame_time is not None:
                             time_since_last_audio = (
-                                time.time() - self._last_audio_frame_time
+                                monotonic() - self._last_audio_frame_time
                             )
                             if (
                                 time_since_last_audio < 0.05
                             ):  # Audio arrived very recently
                                 logger.info(
-                                    "🔄 New audio arrived during initial wait, recalculating..."
+                                    "🔄 New audio arrived just before TTS stopped, recalculating..."
                                 )
                                 # Recalculate input duration (it may have increased)
                                 # Continue to wait and check
@@ -738,55 +926,55 @@ class BitHumanAvatarProcessor(FrameProcessor):
                         max_wait_time = max(
                             self._flush_delay * 2, 2.0
                         )  # At least 2 seconds, or 2x flush_delay
-                        check_interval = 0.05  # Check every 50ms
-                        wait_start = time.time()
-                        last_output_duration = self._output_audio_duration
-                        no_progress_count = 0
-                        max_no_progress_checks = (
-                            20  # 1 second of no progress (20 * 50ms)
-                        )
+                        max_no_progress_time = 1.0  # Give up after 1s of no progress
+                        progress_event = self._output_progress_event
+                        wait_start = monotonic()
+                        last_output_duration = self._output_audio_duration_ns / 1e9
+                        last_progress_time = wait_start
+                        # Safety re-check interval in case a progress signal is missed:
+                        # starts at 10ms, backs off to 100ms while idle, resets on progress
+                        check_interval = 0.01
 
                         logger.info(
                             f"⏳ Waiting for audio processing to complete before flush... "
                             f"(max wait: {max_wait_time}s)"
                         )
 
-                        while time.time() - wait_start < max_wait_time:
+                        while monotonic() - wait_start < max_wait_time:
+                            now = monotonic()
+                            # Snapshot the counters once per wake-up
+                            in_dur = self._input_audio_duration_ns / 1e9
+                            out_dur = self._output_audio_duration_ns / 1e9
+                            # Wake up at the latest when the no-progress window closes
+                            wake_timeout = max_no_progress_time
                             # Check if output has caught up with input
                             # We need 98%+ completion to ensure all buffered audio is processed
-                            if self._input_audio_duration > 0:
-                                completion_ratio = (
-                                    self._output_audio_duration
-                                    / self._input_audio_duration
-                                )
+                            if in_dur > 0:
+                                completion_ratio = out_dur / in_dur
 
                                 # Check if output is making progress
-                                if self._output_audio_duration > last_output_duration:
-                                    no_progress_count = (
-                                        0  # Reset counter if progress made
-                                    )
-                                    last_output_duration = self._output_audio_duration
-                                else:
-                                    no_progress_count += 1
+                                if out_dur > last_output_duration:
+                                    last_progress_time = now
+                                    check_interval = 0.01
+                                    last_output_duration = out_dur
+                                no_progress_time = now - last_progress_time
 
                                 if (
                                     completion_ratio >= 0.98
                                 ):  # 98% of input audio has been output
                                     logger.info(
                                         f"✅ Audio processing complete: {completion_ratio*100:.1f}% "
-                                        f"(input: {self._input_audio_duration:.3f}s, "
-                                        f"output: {self._output_audio_duration:.3f}s)"
+                                        f"(input: {in_dur:.3f}s, output: {out_dur:.3f}s)"
                                     )
                                     break
-                                elif no_progress_count >= max_no_progress_checks:
+                                elif no_progress_time >= max_no_progress_time:
                                     # No progress for 1 second, but check if we're close enough
                                     if (
                                         completion_ratio >= 0.90
                                     ):  # 90% is acceptable if no more progress
                                         logger.warning(
                                             f"⚠️ No audio progress for 1s, but {completion_ratio*100:.1f}% complete. "
-                                            f"Proceeding with flush (input: {self._input_audio_duration:.3f}s, "
-                                            f"output: {self._output_audio_duration:.3f}s)"
+                                            f"Proceeding with flush (input: {in_dur:.3f}s, output: {out_dur:.3f}s)"
                                         )
                                         break
                                     else:
@@ -794,21 +982,29 @@ class BitHumanAvatarProcessor(FrameProcessor):
                                             f"⚠️ No audio progress for 1s, only {completion_ratio*100:.1f}% complete. "
                                             f"Continuing to wait..."
                                         )
-                                        no_progress_count = (
-                                            0  # Reset and continue waiting
+                                        last_progress_time = (
+                                            now  # Reset and continue waiting
                                         )
                                 else:
-                                    logger.debug(
-                                        f"⏳ Waiting for audio processing: {completion_ratio*100:.1f}% "
-                                        f"(input: {self._input_audio_duration:.3f}s, "
-                                        f"output: {self._output_audio_duration:.3f}s, "
-                                        f"no_progress: {no_progress_count}/{max_no_progress_checks})"
+                                    if logger.isEnabledFor(logging.DEBUG):
+                                        logger.debug(
+                                            "⏳ Waiting for audio processing: %.1f%% "
+                                            "(input: %.3fs, output: %.3fs, "
+                                            "no_progress: %.2fs/%ss)",
+                                            completion_ratio * 100,
+                                            in_dur,
+                                            out_dur,
+                                            no_progress_time,
+                                            max_no_progress_time,
+                                        )
+                                    wake_timeout = (
+                                        max_no_progress_time - no_progress_time
                                     )
                             else:
                                 # No input audio tracked, use time-based fallback
                                 if self._last_audio_frame_time is not None:
                                     time_since_last_audio = (
-                                        time.time() - self._last_audio_frame_time
+                                        now - self._last_audio_frame_time
                                     )
                                     if (
                                         time_since_last_audio >= 0.3
@@ -818,23 +1014,31 @@ class BitHumanAvatarProcessor(FrameProcessor):
                                             "proceeding with flush"
                                         )
                                         break
-
-                            await asyncio.sleep(check_interval)
+                                    wake_timeout = 0.3 - time_since_last_audio
+
+                            # Sleep until the render loop reports new output, rather
+                            # than polling; the timeout bounds the no-progress checks
+                            progress_event.clear()
+                            try:
+                                await asyncio.wait_for(
+                                    progress_event.wait(),
+                                    timeout=min(
+                                        wake_timeout,
+                                        check_interval,
+                                        max_wait_time - (now - wait_start),
+                                    ),
+                                )
+                            except asyncio.TimeoutError:
+                                check_interval = min(check_interval * 2, 0.1)
                         else:
                             # Timeout reached
-                            final_ratio = (
-                                (
-                                    self._output_audio_duration
-                                    / self._input_audio_duration
-                                    * 100
-                                )
-                                if self._input_audio_duration > 0
-                                else 0
-                            )
+                            in_dur = self._input_audio_duration_ns / 1e9
+                            out_dur = self._output_audio_duration_ns / 1e9
+                            final_ratio = out_dur / in_dur * 100 if in_dur > 0 else 0
                             logger.warning(
                                 f"⚠️ Flush timeout reached ({max_wait_time}s). "
-                                f"Input: {self._input_audio_duration:.3f}s, "
-                                f"Output: {self._output_audio_duration:.3f}s ({final_ratio:.1f}% complete). "
+                                f"Input: {in_dur:.3f}s, "
+                                f"Output: {out_dur:.3f}s ({final_ratio:.1f}% complete). "
                                 f"Proceeding with flush - some audio may be lost."
                             )
 
@@ -844,53 +1048,54 @@ class BitHumanAvatarProcessor(FrameProcessor):
                         logger.info(
                             "🔚 Pushing final audio chunk with last_chunk=True to trigger AudioStreamBatcher flush"
                         )
-                        # Push a small empty/silence chunk with last_chunk=True
+                        # Push an empty (or, as fallback, 10ms silence) chunk with last_chunk=True
                         # This will trigger AudioStreamBatcher.flush() which processes all buffered audio
-                        silence_bytes = (
-                            b"\x00" * 320
-                        )  # 10ms of silence at 16kHz (160 samples * 2 bytes)
-                        await self._runtime.push_audio(
-                            silence_bytes,
-                            sample_rate=self._sample_rate,
-                            last_chunk=True,  # CRITICAL: This triggers AudioStreamBatcher flush
-                        )
+                        await self._push_last_chunk()
                         logger.info(
                             "✅ Final audio chunk with last_chunk=True pushed, AudioStreamBatcher will flush buffered audio"
                         )
 
                         # CRITICAL: Wait for AudioStreamBatcher to process the flush and output all buffered audio
                         # We need to wait until output catches up with input
-                        flush_wait_start = time.time()
+                        flush_wait_start = monotonic()
                         flush_wait_timeout = (
                             1.0  # Wait up to 1 second for flush to complete
                         )
-                        flush_check_interval = 0.05
 
-                        while time.time() - flush_wait_start < flush_wait_timeout:
-                            if self._input_audio_duration > 0:
-                                completion_ratio = (
-                                    self._output_audio_duration
-                                    / self._input_audio_duration
-                                )
+                        while monotonic() - flush_wait_start < flush_wait_timeout:
+                            in_dur = self._input_audio_duration_ns / 1e9
+                            out_dur = self._output_audio_duration_ns / 1e9
+                            if in_dur > 0:
+                                completion_ratio = out_dur / in_dur
                                 if completion_ratio >= 0.98:  # 98% complete after flush
                                     logger.info(
                                         f"✅ AudioStreamBatcher flush completed: {completion_ratio*100:.1f}% "
-                                        f"(input: {self._input_audio_duration:.3f}s, "
-                                        f"output: {self._output_audio_duration:.3f}s)"
+                                        f"(input: {in_dur:.3f}s, output: {out_dur:.3f}s)"
                                     )
                                     break
                                 else:
-                                    logger.debug(
-                                        f"⏳ Waiting for AudioStreamBatcher flush: {completion_ratio*100:.1f}% "
-                                        f"(input: {self._input_audio_duration:.3f}s, "
-                                        f"output: {self._output_audio_duration:.3f}s)"
-                                    )
-                            await asyncio.sleep(flush_check_interval)
+                                    if logger.isEnabledFor(logging.DEBUG):
+                                        logger.debug(
+                                            "⏳ Waiting for AudioStreamBatcher flush: "
+                                            "%.1f%% (input: %.3fs, output: %.3fs)",
+                                            completion_ratio * 100,
+                                            in_dur,
+                                            out_dur,
+                                        )
+                            progress_event.clear()
+                            try:
+                                await asyncio.wait_for(
+                                    progress_event.wait(),
+                                    timeout=flush_wait_timeout
+                                    - (monotonic() - flush_wait_start),
+                                )
+                            except asyncio.TimeoutError:
+                                pass
                         else:
                             logger.warning(
                                 f"⚠️ AudioStreamBatcher flush timeout ({flush_wait_timeout}s). "
-                                f"Input: {self._input_audio_duration:.3f}s, "
-                                f"Output: {self._output_audio_duration:.3f}s. Proceeding anyway."
+                                f"Input: {self._input_audio_duration_ns / 1e9:.3f}s, "
+                                f"Output: {self._output_audio_duration_ns / 1e9:.3f}s. Proceeding anyway."
                             )
 
                         # Now flush to signal end_of_speech
@@ -910,10 +1115,7 @@ class BitHumanAvatarProcessor(FrameProcessor):
                     except asyncio.CancelledError:
                         logger.debug("🔄 Smart flush cancelled")
                     except Exception as e:
-                        logger.error(f"❌ Error in smart flush: {e}")
-                        import traceback
-
-                        logger.error(traceback.format_exc())
+                        logger.exception("❌ Error in smart flush: %s", e)
 
                 self._flush_task = asyncio.create_task(_smart_flush())
 
@@ -921,119 +1123,121 @@ class BitHumanAvatarProcessor(FrameProcessor):
             # Flushing will break lip-sync for subsequent audio chunks
             # Only flush on explicit interruption or session end
             # The BitHuman runtime will handle continuous audio streams internally
-            # Already called super().process_frame() above, just push downstream
-            await self.push_frame(frame, direction)
-            return
 
         # Handle interruptions
         elif isinstance(frame, (StartInterruptionFrame, InterruptionFrame)):
+            # A pending smart flush and audio that was still being batched belong
+            # to the interrupted speech
+            await self._reset_tts_state(interrupt_runtime=True)
             if self._runtime:
-                self._runtime.interrupt()
-                # Flush on interruption to clear the buffer
-                await self._runtime.flush()
                 logger.info("⏸️  BitHuman runtime interrupted and flushed")
-            await self.push_frame(frame, direction)
 
-        # Pass through other frames
-        elif isinstance(frame, SystemFrame):
-            await self.push_frame(frame, direction)
-        else:
-            # Pass through all other frames
-            await self.push_frame(frame, direction)
+        await self.push_frame(frame, direction)
+
+    async def _push_last_chunk(self):
+        """
+        Push a last_chunk=True marker so the runtime flushes its buffered audio.
+
+        An empty payload is tried first. If the runtime rejects it, 10ms of silence
+        is pushed instead and used for the rest of the session. Batched TTS audio,
+        if any, is pushed as the last chunk instead of a marker.
+        """
+        self._tts_batch += self._flush_resampler()
+        if self._tts_batch:
+            audio_bytes = bytes(self._tts_batch)
+            self._tts_batch.clear()
+            await self._runtime.push_audio(
+                audio_bytes, sample_rate=self._sample_rate, last_chunk=True
+            )
+            return
+
+        if self._empty_last_chunk_supported:
+            try:
+                await self._runtime.push_audio(
+                    b"", sample_rate=self._sample_rate, last_chunk=True
+                )
+                return
+            except Exception as e:
+                logger.info(
+                    "ℹ️  Runtime rejected empty last chunk (%s), using silence instead", e
+                )
+                self._empty_last_chunk_supported = False
+
+        await self._runtime.push_audio(
+            self._silence_10ms, sample_rate=self._sample_rate, last_chunk=True
+        )
+
+    async def _flush_tts_batch(self):
+        """Push any batched TTS audio to the runtime without ending the segment."""
+        self._tts_batch += self._flush_resampler()
+        if not self._tts_batch or not self._runtime:
+            return
+        audio_bytes = bytes(self._tts_batch)
+        self._tts_batch.clear()
+        try:
+            await self._runtime.push_audio(
+                audio_bytes, sample_rate=self._sample_rate, last_chunk=False
+            )
+        except Exception as e:
+            self._log_error("❌ Error pushing batched audio to BitHuman runtime", e)
 
     async def _push_audio_to_runtime(
         self, frame: TTSAudioRawFrame, last_chunk: bool = False
     ):
         """Push TTS audio to BitHuman runtime for processing."""
         if not self._runtime:
-            logger.warning("⚠️  BitHuman runtime not available, cannot push audio")
+            # Rate-limit the warning: this can fire for every TTS chunk
+            now = time.monotonic()
+            if now - self._last_missing_runtime_log >= 60.0:
+                logger.warning("⚠️  BitHuman runtime not available, cannot push audio")
+                self._last_missing_runtime_log = now
             return
 
         try:
             # Convert audio data to bytes if needed
             audio_data = frame.audio
-            original_type = type(audio_data).__name__
             input_sample_rate = frame.sample_rate
             target_sample_rate = (
                 self._sample_rate
             )  # BitHuman runtime sample rate (16000)
 
-            # Resample if sample rates don't match
-            if input_sample_rate != target_sample_rate:
-                logger.warning(
-                    f"⚠️  Sample rate mismatch: TTS={input_sample_rate}Hz, BitHuman={target_sample_rate}Hz. Resampling..."
+            # The rates and payload type are constant for a TTS stream, so the
+            # decoder and resampler are picked once and only rebuilt on a change
+            payload_type = type(audio_data)
+            state = self._resample_state
+            if (
+                state is None
+                or state[0] != input_sample_rate
+                or state[1] != target_sample_rate
+                or state[2] is not payload_type
+            ):
+                state = self._build_resample_state(
+                    input_sample_rate, target_sample_rate, payload_type
                 )
-
-                # Convert bytes to numpy array for resampling
-                if isinstance(audio_data, bytes):
-                    # Assume int16 format
-                    audio_array = np.frombuffer(audio_data, dtype=np.int16)
-                elif isinstance(audio_data, memoryview):
-                    audio_array = np.frombuffer(audio_data, dtype=np.int16)
-                elif isinstance(audio_data, np.ndarray):
-                    audio_array = audio_data
-                else:
-                    logger.error(
-                        f"❌ Cannot resample: unknown audio type {type(audio_data)}"
-                    )
+                if state is None:
                     return
+            decode, resampler = state[3], state[4]
+            audio_bytes = decode(audio_data)
 
-                # Convert to float32 for resampling
-                if audio_array.dtype == np.int16:
-                    audio_float = audio_array.astype(np.float32) / 32767.0
-                else:
-                    audio_float = audio_array.astype(np.float32)
-
-                # Use scipy.signal.resample for better quality resampling
-                # Calculate the number of samples after resampling
-                num_samples = int(
-                    len(audio_float) * target_sample_rate / input_sample_rate
-                )
-                audio_resampled = signal.resample(audio_float, num_samples)
-
-                # Convert back to int16
-                audio_array = (np.clip(audio_resampled, -1.0, 1.0) * 32767).astype(
-                    np.int16
-                )
-                audio_bytes = audio_array.tobytes()
-                # Only log resampling on first occurrence or if it's unexpected
-                if not hasattr(self, "_resample_logged"):
-                    logger.info(
-                        f"🔄 Resampling audio: {input_sample_rate}Hz -> {target_sample_rate}Hz (first occurrence)"
-                    )
-                    self._resample_logged = True
-                else:
+            # Resample if sample rates don't match
+            if resampler is not None:
+                pcm = audio_bytes
+                # The resampler is streaming: it keeps filter state across chunks,
+                # so chunk boundaries don't add artifacts, and may hold back a few
+                # samples until the next push or flush
+                audio_bytes = b"".join(f.data.tobytes() for f in resampler.push(pcm))
+                if logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
-                        f"🔄 Resampled audio: {input_sample_rate}Hz -> {target_sample_rate}Hz ({len(audio_data)} -> {len(audio_bytes)} bytes)"
+                        "🔄 Resampled audio: %dHz -> %dHz (%d -> %d bytes)",
+                        input_sample_rate,
+                        target_sample_rate,
+                        len(pcm),
+                        len(audio_bytes),
                     )
-            else:
-                # No resampling needed
-                if isinstance(audio_data, np.ndarray):
-                    # Ensure it's int16 format for BitHuman
-                    if audio_data.dtype != np.int16:
-                        # Convert float32 to int16 if needed
-                        if audio_data.dtype == np.float32:
-                            # Clamp values to [-1, 1] range before conversion
-                            audio_data = np.clip(audio_data, -1.0, 1.0)
-                            audio_data = (audio_data * 32767).astype(np.int16)
-                            logger.debug(
-                                f"🔄 Converted float32 audio to int16 (shape: {audio_data.shape})"
-                            )
-                        else:
-                            audio_data = audio_data.astype(np.int16)
-                            logger.debug(
-                                f"🔄 Converted {audio_data.dtype} audio to int16"
-                            )
-                    audio_bytes = audio_data.tobytes()
-                elif isinstance(audio_data, memoryview):
-                    audio_bytes = bytes(audio_data)
-                elif isinstance(audio_data, bytes):
-                    audio_bytes = audio_data
-                else:
-                    logger.warning(
-                        f"⚠️  Unknown audio data type: {original_type}, value: {type(audio_data)}"
-                    )
-                    return
+                if last_chunk:
+                    audio_bytes += self._flush_resampler()
+                if not audio_bytes:
+                    return  # Everything is still buffered in the resampler
 
             # CRITICAL: Check if audio_bytes is empty or too small
             # BitHuman runtime's AudioStreamBatcher may require minimum audio size
@@ -1045,18 +1249,30 @@ class BitHumanAvatarProcessor(FrameProcessor):
                 )
                 return
 
-            # Log audio chunk size for debugging
-            audio_samples = len(audio_bytes) // 2  # int16 = 2 bytes per sample
-            audio_duration_ms = (audio_samples / target_sample_rate) * 1000
-            if not hasattr(self, "_audio_chunk_sizes"):
-                self._audio_chunk_sizes = []
-            self._audio_chunk_sizes.append((len(audio_bytes), audio_duration_ms))
+            # Coalesce small TTS chunks into pushes of at least _TTS_BATCH_MS so each
+            # runtime push carries more audio; last_chunk always pushes what is pending
+            batch_size = self._TTS_BATCH_MS * target_sample_rate // 1000 * 2
+            if self._tts_batch or len(audio_bytes) < batch_size:
+                self._tts_batch += audio_bytes
+                if len(self._tts_batch) < batch_size and not last_chunk:
+                    return
+                audio_bytes = bytes(self._tts_batch)
+                self._tts_batch.clear()
+
+            # Track audio chunk size for debugging
+            self._audio_chunk_sizes[
+                self._audio_chunk_push_count & (self._AUDIO_CHUNK_HISTORY - 1)
+            ] = len(audio_bytes)
+            self._audio_chunk_push_count += 1
 
             # Log first few chunks and periodically to track audio flow
-            if (
-                len(self._audio_chunk_sizes) <= 10
-                or len(self._audio_chunk_sizes) % 50 == 0
-            ):
+            log_chunk = (
+                self._audio_chunk_push_count <= 10
+                or self._audio_chunk_push_count % 50 == 0
+            )
+            if log_chunk:
+                audio_samples = len(audio_bytes) // 2  # int16 = 2 bytes per sample
+                audio_duration_ms = (audio_samples / target_sample_rate) * 1000
                 logger.info(
                     f"📦 Pushing audio chunk: {len(audio_bytes)} bytes ({audio_samples} samples, "
                     f"{audio_duration_ms:.1f}ms @ {target_sample_rate}Hz)"
@@ -1075,45 +1291,92 @@ class BitHumanAvatarProcessor(FrameProcessor):
                     sample_rate=target_sample_rate,  # Use target sample rate
                     last_chunk=last_chunk,  # Use the provided last_chunk parameter
                 )
-                # Log successful push
-                if len(self._audio_chunk_sizes) <= 10:
+                # Log first few successful pushes to verify timing
+                if log_chunk and self._audio_chunk_push_count <= 10:
                     logger.info(
-                        f"✅ Successfully pushed audio chunk #{len(self._audio_chunk_sizes)} "
-                        f"({len(audio_bytes)} bytes, {audio_duration_ms:.1f}ms)"
+                        f"✅ Successfully pushed audio chunk #{self._audio_chunk_push_count} "
+                        f"({len(audio_bytes)} bytes, {audio_duration_ms:.1f}ms, "
+                        f"sample_rate: {target_sample_rate}Hz, last_chunk: {last_chunk})"
                     )
             except Exception as push_error:
+                audio_duration_ms = len(audio_bytes) / 2 / target_sample_rate * 1000
                 logger.error(
                     f"❌ Failed to push audio to runtime: {push_error} "
                     f"(chunk size: {len(audio_bytes)} bytes, {audio_duration_ms:.1f}ms)"
                 )
-                import traceback
-
-                logger.error(traceback.format_exc())
-                raise
-
-            # Track audio push timing for debugging
-            if not hasattr(self, "_audio_push_count"):
-                self._audio_push_count = 0
-            self._audio_push_count += 1
-
-            # Log first few audio pushes to verify timing
-            if self._audio_push_count <= 5:
-                logger.info(
-                    f"🎵 Pushed audio chunk #{self._audio_push_count} to runtime (size: {len(audio_bytes)} bytes, sample_rate: {target_sample_rate}Hz, last_chunk: {last_chunk})"
-                )
-            # Only log occasionally to avoid log spam
-            if not hasattr(self, "_push_count"):
-                self._push_count = 0
-            self._push_count += 1
-            if self._push_count <= 5 or self._push_count % 50 == 0:
-                logger.debug(
-                    f"✅ Pushed audio chunk #{self._push_count} ({len(audio_bytes)} bytes, {target_sample_rate}Hz)"
-                )
+                raise  # Traceback is logged once by the handler below
         except Exception as e:
-            logger.error(f"❌ Error pushing audio to BitHuman runtime: {e}")
-            import traceback
+            self._log_error("❌ Error pushing audio to BitHuman runtime", e)
+
+    def _build_resample_state(
+        self, input_sample_rate: int, target_sample_rate: int, payload_type: type
+    ) -> tuple[int, int, type, Callable, AudioResampler | None] | None:
+        """
+        Pick the decoder and resampler for a TTS stream's rates and payload type.
 
-            logger.error(traceback.format_exc())
+        Returns None, leaving the cached state unchanged, for unsupported payloads.
+        """
+        needs_resample = input_sample_rate != target_sample_rate
+        decode = (
+            _AUDIO_BYTEARRAY_DECODERS if needs_resample else _AUDIO_BYTES_DECODERS
+        ).get(payload_type)
+        if decode is None:
+            logger.warning(f"⚠️  Unknown audio data type: {payload_type.__name__}")
+            return None
+
+        resampler = None
+        state = self._resample_state
+        if not needs_resample:
+            pass
+        elif (
+            state is not None
+            and state[0] == input_sample_rate
+            and state[1] == target_sample_rate
+        ):
+            # Only the payload type changed; keep the stream's filter state
+            resampler = state[4]
+        else:
+            logger.warning(
+                f"⚠️  Sample rate mismatch: TTS={input_sample_rate}Hz, "
+                f"BitHuman={target_sample_rate}Hz. Resampling..."
+            )
+            resampler = _new_resampler(input_sample_rate, target_sample_rate)
+        self._resample_state = (
+            input_sample_rate,
+            target_sample_rate,
+            payload_type,
+            decode,
+            resampler,
+        )
+        return self._resample_state
+
+    def _flush_resampler(self) -> bytes:
+        """Return the audio held back by the resampler and end its stream."""
+        state = self._resample_state
+        if state is None or state[4] is None:
+            return b""
+        input_sample_rate, target_sample_rate, payload_type, decode, resampler = state
+        # The next TTS segment starts with a fresh resampler
+        self._resample_state = (
+            input_sample_rate,
+            target_sample_rate,
+            payload_type,
+            decode,
+            _new_resampler(input_sample_rate, target_sample_rate),
+        )
+        return b"".join(f.data.tobytes() for f in resampler.flush())
+
+    def _log_error(self, message: str, error: Exception) -> None:
+        """Log an error, sampling tracebacks per call site (keyed by message)."""
+        count = self._error_log_counts.get(message, 0) + 1
+        self._error_log_counts[message] = count
+        if (
+            count <= self._MAX_TRACEBACK_LOGS
+            or count % self._TRACEBACK_SAMPLE_EVERY == 0
+        ):
+            logger.exception("%s (#%d): %s", message, count, error)
+        else:
+            logger.error("%s (#%d, traceback suppressed): %r", message, count, error)
 
     async def _render_loop(self):
         """
@@ -1128,6 +1391,9 @@ class BitHumanAvatarProcessor(FrameProcessor):
         frame_count = 0
         video_frame_count = 0
         audio_frame_count = 0
+        end_of_speech_detected = False
+        frames_after_eos = 0
+        push_tasks: list[asyncio.Task] = []
 
         try:
             # Check if runtime is ready
@@ -1137,11 +1403,53 @@ class BitHumanAvatarProcessor(FrameProcessor):
 
             logger.info("✅ Starting to iterate over runtime.run()...")
             logger.info(
-                f"📊 Starting render loop - Input audio duration so far: {self._input_audio_duration:.3f}s"
+                "📊 Starting render loop - Input audio duration so far: %.3fs",
+                self._input_audio_duration_ns / 1e9,
             )
-            end_of_speech_detected = False
-            frames_after_eos = 0
-            last_output_duration_log = 0.0
+
+            # Bind per-frame attributes to locals once; local lookups are cheaper
+            # than attribute lookups at 25+ fps. _running and the audio durations
+            # are still read from self because other tasks update them.
+            log_info = logger.info
+            progress_event = self._output_progress_event
+            video_color_format = self._video_color_format
+            run_in_executor = asyncio.get_running_loop().run_in_executor
+            cv_executor = self._cv_executor
+            # Pipecat frames carry a unique id and are queued downstream, so a
+            # fresh frame is needed per push; only the class lookup is hoisted
+            output_image_frame = OutputImageRawFrame
+            # Audio frames are built by a factory with the session's fixed
+            # sample rate and channel count bound; rebuilt if the rate changes
+            make_audio_frame = None
+            make_audio_frame_rate = None
+            # Pending audio when batching is enabled (see audio_batch_duration)
+            audio_batch_target = self._audio_batch_duration
+            audio_batch = bytearray()
+            audio_batch_duration = 0.0
+            # Only the first five audio frames are logged; the flag is cleared
+            # after the fifth so later frames skip the check entirely
+            log_first_audio_frames = True
+
+            # Frames are handed to bounded queues and pushed downstream by separate
+            # tasks, so a downstream stall doesn't stop the runtime from being
+            # drained. A full video queue drops its oldest frame; audio waits.
+            video_queue = self._video_queue
+            audio_queue = self._audio_queue
+            self._drain_output_queues()
+            push_tasks = [
+                asyncio.create_task(self._push_queued_frames(video_queue)),
+                asyncio.create_task(self._push_queued_frames(audio_queue)),
+            ]
+            # Output generation of the frames being rendered. Frames are queued
+            # with it, and audio batched before an interruption is discarded.
+            generation = self._output_generation
+
+            async def push_audio(frame: Frame) -> None:
+                await audio_queue.put((generation, frame))
+
+            monotonic_ns = time.monotonic_ns
+            late_video_tolerance_ns = self._LATE_VIDEO_TOLERANCE_NS
+            late_video_resync_ns = self._LATE_VIDEO_RESYNC_NS
 
             async for bh_frame in self._runtime.run():
                 if not self._running:
@@ -1149,15 +1457,21 @@ class BitHumanAvatarProcessor(FrameProcessor):
 
                 frame_count += 1
 
+                if generation != self._output_generation:
+                    # Interrupted: audio still being batched is stale
+                    generation = self._output_generation
+                    audio_batch.clear()
+                    audio_batch_duration = 0.0
+
                 # CRITICAL: Track end_of_speech but continue processing all frames
                 # The runtime may continue generating frames after end_of_speech=True
                 # We must push ALL frames until runtime naturally stops
                 if bh_frame.end_of_speech:
                     if not end_of_speech_detected:
-                        logger.info(
+                        log_info(
                             "🎯 END OF SPEECH DETECTED: Runtime signaled end of speech"
                         )
-                        logger.info(
+                        log_info(
                             "🎯 Continuing to process all remaining frames until runtime stops..."
                         )
                         end_of_speech_detected = True
@@ -1165,8 +1479,11 @@ class BitHumanAvatarProcessor(FrameProcessor):
 
                     # Log first few frames after EOS to track progress
                     if frames_after_eos <= 5:
-                        logger.info(
-                            f"🔄 Processing frame #{frame_count} after end_of_speech (frames_after_eos: {frames_after_eos})"
+                        log_info(
+                            "[eos] Processing frame #%d after end_of_speech "
+                            "(frames_after_eos: %d)",
+                            frame_count,
+                            frames_after_eos,
                         )
 
                 # CRITICAL: Match LiveKit BithumanGenerator pattern - only push what runtime generates
@@ -1182,8 +1499,6 @@ class BitHumanAvatarProcessor(FrameProcessor):
 
                 # Log when video frame has no audio (this is the problem!)
                 if has_video and not has_audio:
-                    if not hasattr(self, "_video_without_audio_count"):
-                        self._video_without_audio_count = 0
                     self._video_without_audio_count += 1
 
                     # Log first few and periodically
@@ -1192,172 +1507,312 @@ class BitHumanAvatarProcessor(FrameProcessor):
                         or self._video_without_audio_count % 50 == 0
                     ):
                         logger.warning(
-                            f"⚠️  Video frame #{video_frame_count + 1} has NO audio chunk! "
-                            f"(total video frames without audio: {self._video_without_audio_count})"
+                            "[warn] Video frame #%d has NO audio chunk! "
+                            "(total video frames without audio: %d)",
+                            video_frame_count + 1,
+                            self._video_without_audio_count,
                         )
 
+                # Audio is the master clock. A speech frame's timestamp is the
+                # segment audio output before its own chunk; once the segment
+                # has started playing, audio advances in real time, so a frame
+                # rendered more than the tolerance after its timestamp is late.
+                # Skip it (and its color conversion) so rendering can catch up.
+                # Audio is always pushed.
+                if has_video and has_audio:
+                    now_ns = monotonic_ns()
+                    frame_pts_ns = self._output_audio_duration_ns
+                    clock_start_ns = self._segment_clock_start_ns
+                    if clock_start_ns is None:
+                        self._segment_clock_start_ns = now_ns - frame_pts_ns
+                    else:
+                        lag_ns = now_ns - clock_start_ns - frame_pts_ns
+                        if lag_ns > late_video_resync_ns:
+                            # Audio output stalled as well; restart the clock here
+                            self._segment_clock_start_ns = now_ns - frame_pts_ns
+                        elif lag_ns > late_video_tolerance_ns:
+                            self._late_video_count += 1
+                            has_video = False
+                elif not has_audio:
+                    # A gap in the audio pauses playback; re-anchor on resume
+                    self._segment_clock_start_ns = None
+
                 # Push video frame if available (matching LiveKit pattern)
                 if has_video:
-                    # Convert BGR to RGB for Pipecat/Daily (most video encoders expect RGB)
-                    rgb_image = cv2.cvtColor(bh_frame.bgr_image, cv2.COLOR_BGR2RGB)
+                    bgr_image = bh_frame.bgr_image
+                    if video_color_format == "BGR":
+                        # Transport accepts BGR: hand over the runtime image unchanged
+                        video_image = bgr_image
+                    else:
+                        # Convert BGR to RGB for Pipecat/Daily (most video encoders
+                        # expect RGB). Each frame gets a fresh image: the transport
+                        # may still hold earlier frames in its own queues.
+                        video_image = await run_in_executor(
+                            cv_executor, cv2.cvtColor, bgr_image, cv2.COLOR_BGR2RGB
+                        )
 
-                    # Ensure image is contiguous in memory for better performance
-                    if not rgb_image.flags["C_CONTIGUOUS"]:
-                        rgb_image = np.ascontiguousarray(rgb_image)
+                    # The runtime renders at a fixed size; build the size tuple once
+                    if self._video_size is None:
+                        self._video_size = (video_image.shape[1], video_image.shape[0])
 
                     # OutputImageRawFrame expects numpy array, not bytes
-                    # Use RGB format for video encoding (most codecs expect RGB)
-                    video_frame = OutputImageRawFrame(
-                        image=rgb_image,  # Pass numpy array directly (RGB format)
-                        size=(rgb_image.shape[1], rgb_image.shape[0]),
-                        format="RGB",  # Use RGB for video encoding (not RGBA)
+                    video_frame = output_image_frame(
+                        image=video_image,  # Pass numpy array directly
+                        size=self._video_size,
+                        format=video_color_format,
                     )
-                    await self.push_frame(video_frame)
+                    if video_queue.full():
+                        # Downstream is behind: drop the oldest frame, keep the newest
+                        video_queue.get_nowait()
+                        self._dropped_video_count += 1
+                    video_queue.put_nowait((generation, video_frame))
                     video_frame_count += 1
 
                     # Log first few video frames
                     if video_frame_count <= 5:
-                        logger.info(
-                            f"📹 Pushed video frame #{video_frame_count} to pipeline "
-                            f"(size: {rgb_image.shape[1]}x{rgb_image.shape[0]}, format: RGB, "
-                            f"has_audio: {has_audio})"
+                        log_info(
+                            "[video] Queued video frame #%d for the pipeline "
+                            "(size: %dx%d, format: %s, has_audio: %s)",
+                            video_frame_count,
+                            self._video_size[0],
+                            self._video_size[1],
+                            video_color_format,
+                            has_audio,
                         )
 
                 # Push audio frame if available (matching LiveKit pattern)
                 # Runtime generates audio chunks synchronized with video frames
                 # We only push what runtime generates - no empty frames
                 if has_audio:
+                    # Read the chunk's fields once; they are used several times below
+                    chunk = bh_frame.audio_chunk
+                    audio_sample_rate = chunk.sample_rate
                     # Get audio bytes directly (AudioChunk.bytes property returns data.tobytes())
                     # This matches agent.py line 162: data=frame.audio_chunk.bytes
-                    audio_bytes = bh_frame.audio_chunk.bytes
+                    audio_bytes = chunk.bytes
 
                     # Verify it's bytes (should always be from AudioChunk.bytes property)
                     if not isinstance(audio_bytes, bytes):
                         # Fallback: convert from array if needed
-                        audio_array = bh_frame.audio_chunk.array
+                        audio_array = chunk.array
                         if audio_array.dtype != np.int16:
-                            audio_array = (audio_array * 32767).astype(np.int16)
+                            # Scale, clip and cast through reusable buffers; the
+                            # clip keeps out-of-range samples from wrapping around
+                            n = len(audio_array)
+                            if len(self._render_scratch_f32) < n:
+                                self._render_scratch_f32 = np.empty(n, dtype=np.float32)
+                                self._render_scratch_i16 = np.empty(n, dtype=np.int16)
+                            scratch = self._render_scratch_f32[:n]
+                            np.multiply(audio_array, 32767.0, out=scratch)
+                            np.clip(scratch, -32767.0, 32767.0, out=scratch)
+                            audio_array = self._render_scratch_i16[:n]
+                            np.copyto(audio_array, scratch, casting="unsafe")
                         audio_bytes = audio_array.tobytes()
 
-                    # Track output audio duration for completion detection
-                    # AudioChunk has duration property, but we can also calculate it
-                    audio_duration = bh_frame.audio_chunk.duration
-                    self._output_audio_duration += audio_duration
+                    # Track output audio duration for completion detection.
+                    # Derived from the byte count like the input side, so both
+                    # totals are integer nanoseconds computed the same way.
+                    audio_duration = chunk.duration
+                    # Accumulate into a local and publish once per chunk. The counter is
+                    # re-read here rather than held across awaits because
+                    # TTSStartedFrame resets it at the start of each segment.
+                    output_duration_ns = self._output_audio_duration_ns + (
+                        _pcm16_duration_ns(len(audio_bytes), audio_sample_rate)
+                    )
+                    self._output_audio_duration_ns = output_duration_ns
+                    progress_event.set()
 
-                    # Log periodically to track progress
-                    if (
-                        self._output_audio_duration - last_output_duration_log >= 0.5
-                    ):  # Every 0.5s
+                    # Log periodically to track progress (every Nth audio chunk)
+                    if audio_frame_count % self._AUDIO_PROGRESS_LOG_STRIDE == 0:
+                        input_duration_ns = self._input_audio_duration_ns
                         completion_ratio = (
-                            (
-                                self._output_audio_duration
-                                / self._input_audio_duration
-                                * 100
-                            )
-                            if self._input_audio_duration > 0
-                            else 0
+                            output_duration_ns * 100.0 / input_duration_ns
+                            if input_duration_ns > 0
+                            else 0.0
                         )
-                        logger.info(
-                            f"📊 Audio processing: input={self._input_audio_duration:.3f}s, "
-                            f"output={self._output_audio_duration:.3f}s "
-                            f"({completion_ratio:.1f}% complete)"
+                        log_info(
+                            "[audio] Audio processing: input=%.3fs, output=%.3fs "
+                            "(%.1f%% complete)",
+                            input_duration_ns / 1e9,
+                            output_duration_ns / 1e9,
+                            completion_ratio,
                         )
-                        last_output_duration_log = self._output_audio_duration
-                    else:
+                    elif logger.isEnabledFor(logging.DEBUG):
                         logger.debug(
-                            f"📊 Output audio duration: {self._output_audio_duration:.3f}s "
-                            f"(added {audio_duration:.3f}s)"
+                            "[audio] Output audio duration: %.3fs (added %.3fs)",
+                            output_duration_ns / 1e9,
+                            audio_duration,
                         )
 
                     # Create audio frame matching agent.py format (rtc.AudioFrame with bytes data)
-                    audio_frame = OutputAudioRawFrame(
-                        audio=audio_bytes,  # Direct bytes from AudioChunk.bytes
-                        sample_rate=bh_frame.audio_chunk.sample_rate,
-                        num_channels=1,
-                    )
-                    await self.push_frame(audio_frame)
+                    if audio_sample_rate != make_audio_frame_rate:
+                        if audio_batch:
+                            # Pending audio was produced at the previous rate
+                            await push_audio(make_audio_frame(audio=bytes(audio_batch)))
+                            audio_batch.clear()
+                            audio_batch_duration = 0.0
+                        make_audio_frame = functools.partial(
+                            OutputAudioRawFrame,
+                            sample_rate=audio_sample_rate,
+                            num_channels=1,
+                        )
+                        make_audio_frame_rate = audio_sample_rate
                     audio_frame_count += 1
 
-                    # Log first few audio frames
-                    if audio_frame_count <= 5:
-                        logger.info(
-                            f"🔊 Pushed audio frame #{audio_frame_count} to pipeline "
-                            f"(sample_rate: {bh_frame.audio_chunk.sample_rate}, "
-                            f"size: {len(audio_bytes)} bytes, duration: {audio_duration:.3f}s)"
-                        )
+                    if audio_batch_target > 0.0:
+                        # Hold the chunk until the batch is long enough; never hold
+                        # audio past the end of speech
+                        audio_batch += audio_bytes
+                        audio_batch_duration += audio_duration
+                        if (
+                            audio_batch_duration >= audio_batch_target
+                            or bh_frame.end_of_speech
+                        ):
+                            audio_bytes = bytes(audio_batch)
+                            audio_duration = audio_batch_duration
+                            audio_batch.clear()
+                            audio_batch_duration = 0.0
+                        else:
+                            audio_bytes = None
+
+                    if audio_bytes is not None:
+                        # Direct bytes from AudioChunk.bytes
+                        audio_frame = make_audio_frame(audio=audio_bytes)
+                        await push_audio(audio_frame)
+
+                        # Log first few audio frames
+                        if log_first_audio_frames:
+                            log_info(
+                                "[audio] Queued audio frame #%d for the pipeline "
+                                "(sample_rate: %d, size: %d bytes, duration: %.3fs)",
+                                audio_frame_count,
+                                audio_sample_rate,
+                                len(audio_bytes),
+                                audio_duration,
+                            )
+                            log_first_audio_frames = audio_frame_count < 5
+                elif audio_batch:
+                    # The runtime paused audio; don't hold the pending batch
+                    await push_audio(make_audio_frame(audio=bytes(audio_batch)))
+                    audio_batch.clear()
+                    audio_batch_duration = 0.0
 
                 # Log progress periodically
                 if frame_count % 250 == 0:
-                    logger.info(
-                        f"📊 Rendered {frame_count} frames (video: {video_frame_count}, audio: {audio_frame_count})"
+                    log_info(
+                        "[render] Rendered %d frames (video: %d, audio: %d, "
+                        "after end_of_speech: %s)",
+                        frame_count,
+                        video_frame_count,
+                        audio_frame_count,
+                        frames_after_eos if end_of_speech_detected else "n/a",
                     )
-                    if end_of_speech_detected:
-                        logger.info(
-                            f"📊 Frames after end_of_speech: {frames_after_eos}"
-                        )
 
         except asyncio.CancelledError:
             logger.info("⏹️  BitHuman render loop cancelled")
         except Exception as e:
-            logger.error(f"❌ Error in BitHuman render loop: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            self._log_error("❌ Error in BitHuman render loop", e)
         finally:
-            logger.info(
-                f"✅ Render loop completed. Total frames: {frame_count} "
-                f"(video: {video_frame_count}, audio: {audio_frame_count})"
+            for task in push_tasks:
+                task.cancel()
+            await asyncio.gather(*push_tasks, return_exceptions=True)
+            self._drain_output_queues()
+            self._log_final_audio_summary(
+                frame_count,
+                video_frame_count,
+                audio_frame_count,
+                end_of_speech_detected,
+                frames_after_eos,
             )
-            if end_of_speech_detected:
-                logger.info(
-                    f"✅ Processed {frames_after_eos} frames after end_of_speech signal"
-                )
 
-            # Final audio duration summary for debugging
+    async def _push_queued_frames(self, queue: asyncio.Queue) -> None:
+        """Push frames from a render-loop output queue downstream, in order."""
+        push_frame = self.push_frame
+        while True:
+            generation, frame = await queue.get()
+            if generation != self._output_generation:
+                # Queued (or blocked on a full queue) before an interruption
+                continue
+            # A failed push must not kill this task: the render loop would then
+            # block forever on the full audio queue
+            try:
+                await push_frame(frame)
+            except Exception as e:
+                self._log_error("❌ Error pushing frame downstream", e)
+
+    def _log_final_audio_summary(
+        self,
+        frame_count: int,
+        video_frame_count: int,
+        audio_frame_count: int,
+        end_of_speech_detected: bool,
+        frames_after_eos: int,
+    ) -> None:
+        """Log frame counts and audio completion stats when the render loop ends."""
+        summary = [
+            f"Total frames: {frame_count}",
+            f"video: {video_frame_count}",
+            f"audio: {audio_frame_count}",
+        ]
+        if end_of_speech_detected:
+            summary.append(f"after end_of_speech: {frames_after_eos}")
+        if self._dropped_video_count:
+            summary.append(f"video dropped: {self._dropped_video_count}")
+        if self._late_video_count:
+            summary.append(f"video late: {self._late_video_count}")
+        logger.info("✅ Render loop completed. %s", " | ".join(summary))
+
+        # Final audio duration summary for debugging
+        input_duration_ns = self._input_audio_duration_ns
+        output_duration_ns = self._output_audio_duration_ns
+        logger.info(
+            "📊 FINAL AUDIO SUMMARY: Input=%.3fs, Output=%.3fs",
+            input_duration_ns / 1e9,
+            output_duration_ns / 1e9,
+        )
+        if input_duration_ns > 0:
+            completion_ratio = output_duration_ns * 100 / input_duration_ns
             logger.info(
-                f"📊 FINAL AUDIO SUMMARY: "
-                f"Input={self._input_audio_duration:.3f}s, "
-                f"Output={self._output_audio_duration:.3f}s"
+                "📊 Audio completion ratio: %.1f%% (%s)",
+                completion_ratio,
+                "✅ Complete"
+                if completion_ratio >= 95
+                else "⚠️ Incomplete - audio may be missing!",
+            )
+        if self._tts_audio_frame_count:
+            logger.info(
+                "📊 Total TTS audio frames received: %d", self._tts_audio_frame_count
+            )
+        if self._audio_chunk_push_count:
+            recent_chunks = min(
+                self._audio_chunk_push_count, self._AUDIO_CHUNK_HISTORY
+            )
+            avg_size = float(self._audio_chunk_sizes[:recent_chunks].mean())
+            # Chunks are int16 at the runtime sample rate
+            avg_duration = avg_size / 2 / self._sample_rate * 1000
+            logger.info(
+                "📊 Audio chunks pushed to runtime: %d "
+                "(last %d avg size: %.0f bytes, avg duration: %.1fms)",
+                self._audio_chunk_push_count,
+                recent_chunks,
+                avg_size,
+                avg_duration,
             )
-            if self._input_audio_duration > 0:
-                completion_ratio = (
-                    self._output_audio_duration / self._input_audio_duration
-                ) * 100
-                logger.info(
-                    f"📊 Audio completion ratio: {completion_ratio:.1f}% "
-                    f"({'✅ Complete' if completion_ratio >= 95 else '⚠️ Incomplete - audio may be missing!'})"
-                )
-            if hasattr(self, "_tts_audio_frame_count"):
-                logger.info(
-                    f"📊 Total TTS audio frames received: {self._tts_audio_frame_count}"
-                )
-            if hasattr(self, "_audio_chunk_sizes") and self._audio_chunk_sizes:
-                total_chunks = len(self._audio_chunk_sizes)
-                avg_size = (
-                    sum(size for size, _ in self._audio_chunk_sizes) / total_chunks
-                )
-                avg_duration = (
-                    sum(dur for _, dur in self._audio_chunk_sizes) / total_chunks
-                )
-                logger.info(
-                    f"📊 Audio chunks pushed to runtime: {total_chunks} "
-                    f"(avg size: {avg_size:.0f} bytes, avg duration: {avg_duration:.1f}ms)"
-                )
 
-            # CRITICAL: Report video/audio frame mismatch
-            if hasattr(self, "_video_without_audio_count"):
-                logger.warning(
-                    f"⚠️  VIDEO/AUDIO MISMATCH: {self._video_without_audio_count} video frames "
-                    f"had NO audio chunk! This causes lip-sync issues."
-                )
-                logger.warning(
-                    f"⚠️  Video frames: {video_frame_count}, Audio frames: {audio_frame_count}, "
-                    f"Ratio: {video_frame_count/audio_frame_count if audio_frame_count > 0 else 'N/A'}:1"
-                )
-                logger.warning(
-                    "⚠️  This suggests AudioStreamBatcher is not yielding audio frequently enough, "
-                    "or audio is being buffered and not flushed properly."
-                )
+        # CRITICAL: Report video/audio frame mismatch
+        if self._video_without_audio_count:
+            logger.warning(
+                "⚠️  VIDEO/AUDIO MISMATCH: %d video frames had no audio chunk "
+                "(video frames: %d, audio frames: %d), which causes lip-sync "
+                "issues. Check the AudioStreamBatcher flush cadence.",
+                self._video_without_audio_count,
+                video_frame_count,
+                audio_frame_count,
+            )
+
+    async def wait_ready(self) -> None:
+        """Wait until the BitHuman runtime is initialized and rendering."""
+        await self._ready.wait()
 
     @property
     def frame_size(self) -> tuple[int, int]:
@@ -1370,35 +1825,50 @@ class BitHumanAvatarProcessor(FrameProcessor):
         return self._sample_rate
 
 
-async def create_daily_room(api_key: str, room_name: Optional[str] = None) -> dict:
+async def create_daily_room(
+    api_key: str,
+    room_name: str | None = None,
+    *,
+    session: aiohttp.ClientSession | None = None,
+) -> dict:
     """
     Create a Daily.co room using the REST API.
 
     Args:
         api_key: Daily.co API key
         room_name: Optional room name (auto-generated if not provided)
+        session: Optional HTTP session to reuse; a temporary one is used if omitted
 
     Returns:
         Dictionary containing room information including URL
     """
-    async with aiohttp.ClientSession() as session:
-        headers = {"Authorization": f"Bearer {api_key}"}
-        data = {}
-        if room_name:
-            data["name"] = room_name
-
-        async with session.post(
-            "https://api.daily.co/v1/rooms",
-            headers=headers,
-            json=data,
-        ) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise Exception(f"Failed to create room: {error_text}")
-            return await response.json()
-
-
-async def get_meeting_token(api_key: str, room_name: str, owner: bool = True) -> str:
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await create_daily_room(api_key, room_name, session=session)
+
+    headers = {"Authorization": f"Bearer {api_key}"}
+    data = {}
+    if room_name:
+        data["name"] = room_name
+
+    async with session.post(
+        "https://api.daily.co/v1/rooms",
+        headers=headers,
+        json=data,
+    ) as response:
+        if response.status != 200:
+            error_text = await response.text()
+            raise Exception(f"Failed to create room: {error_text}")
+        return await response.json()
+
+
+async def get_meeting_token(
+    api_key: str,
+    room_name: str,
+    owner: bool = True,
+    *,
+    session: aiohttp.ClientSession | None = None,
+) -> str:
     """
     Generate a meeting token for joining a Daily.co room.
 
@@ -1406,29 +1876,33 @@ async def get_meeting_token(api_key: str, room_name: str, owner: bool = True) ->
         api_key: Daily.co API key
         room_name: Name of the room
         owner: Whether the token should have owner privileges
+        session: Optional HTTP session to reuse; a temporary one is used if omitted
 
     Returns:
         Meeting token string
     """
-    async with aiohttp.ClientSession() as session:
-        headers = {"Authorization": f"Bearer {api_key}"}
-        data = {
-            "properties": {
-                "room_name": room_name,
-                "is_owner": owner,
-            }
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await get_meeting_token(api_key, room_name, owner, session=session)
+
+    headers = {"Authorization": f"Bearer {api_key}"}
+    data = {
+        "properties": {
+            "room_name": room_name,
+            "is_owner": owner,
         }
+    }
 
-        async with session.post(
-            "https://api.daily.co/v1/meeting-tokens",
-            headers=headers,
-            json=data,
-        ) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise Exception(f"Failed to create token: {error_text}")
-            result = await response.json()
-            return result["token"]
+    async with session.post(
+        "https://api.daily.co/v1/meeting-tokens",
+        headers=headers,
+        json=data,
+    ) as response:
+        if response.status != 200:
+            error_text = await response.text()
+            raise Exception(f"Failed to create token: {error_text}")
+        result = await response.json()
+        return result["token"]
 
 
 async def main(args: argparse.Namespace):
@@ -1462,20 +1936,25 @@ async def main(args: argparse.Namespace):
     if not openai_api_key:
         raise ValueError("OPENAI_API_KEY environment variable is required")
 
-    # Get or create Daily room
-    room_url = args.room_url
-    if not room_url:
-        logger.info("Creating new Daily.co room...")
-        room_info = await create_daily_room(daily_api_key)
-        room_url = room_info["url"]
-        logger.info(f"Created room: {room_url}")
-
-    # Extract room name from URL
-    room_name = room_url.split("/")[-1]
-
-    # Generate meeting token
-    token = await get_meeting_token(daily_api_key, room_name)
-    logger.info(f"Generated meeting token for room: {room_name}")
+    # Share one HTTP session for the Daily REST calls so the connection to
+    # api.daily.co (and its TLS handshake) is reused
+    async with aiohttp.ClientSession() as session:
+        # Get or create Daily room
+        room_url = args.room_url
+        if not room_url:
+            logger.info("Creating new Daily.co room...")
+            room_info = await create_daily_room(daily_api_key, session=session)
+            room_url = room_info["url"]
+            logger.info(f"Created room: {room_url}")
+
+        # Extract room name from URL
+        room_name = room_url.split("/")[-1]
+
+        # Generate meeting token
+        token = await get_meeting_token(
+            daily_api_key, room_name, session=session
+        )
+        logger.info(f"Generated meeting token for room: {room_name}")
 
     # Configure Daily transport with default video size
     # Note: We'll update this after BitHuman runtime initializes with actual frame size
@@ -1557,11 +2036,11 @@ async def main(args: argparse.Namespace):
     )
     logger.info("✅ BitHuman Avatar Processor initialized")
 
-    # Get actual frame size from BitHuman runtime (after initialization)
-    # We need to wait a bit for the runtime to initialize
-    await asyncio.sleep(0.5)  # Give runtime time to initialize
-    actual_frame_size = bithuman_avatar.frame_size
-    logger.info(f"📐 BitHuman actual frame size: {actual_frame_size}")
+    # The runtime is initialized when the pipeline delivers its StartFrame, so
+    # report the actual frame size once the processor signals it is ready
+    async def log_frame_size():
+        await bithuman_avatar.wait_ready()
+        logger.info(f"📐 BitHuman actual frame size: {bithuman_avatar.frame_size}")
 
     # Build the pipeline
     # Input: User audio from Daily → Deepgram STT → LLM → TTS → BitHuman → Output video/audio to Daily
@@ -1629,7 +2108,11 @@ async def main(args: argparse.Namespace):
     logger.info(f"Agent ready! Join the room at: {room_url}")
     logger.info("Waiting for participants...")
 
-    await runner.run(task)
+    frame_size_task = asyncio.create_task(log_frame_size())
+    try:
+        await runner.run(task)
+    finally:
+        frame_size_task.cancel()
 
 
 def parse_args() -> argparse.Namespace:
@@ -1669,4 +2152,7 @@ if __name__ == "__main__":
     else:
         logging.basicConfig(level=logging.INFO)
 
-    asyncio.run(main(args))
+    if uvloop is not None:
+        uvloop.run(main(args))
+    else:
+        asyncio.run(main(args))
@@ -92,6 +92,12 @@ from scipy import signal
 # BitHuman imports
 from bithuman import AsyncBithuman
 
+# uvloop is optional and not available on Windows; fall back to asyncio's loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Configure logging
 logger = logging.getLogger("bithuman-pipecat-livekit-agent")
 logger.setLevel(logging.INFO)
@@ -100,6 +106,8 @@ handler.setFormatter(
     logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
 logger.addHandler(handler)
+# Don't also print every record through the root handler set up by basicConfig()
+logger.propagate = False
 
 # Load environment variables
 load_dotenv()
@@ -113,6 +121,10 @@ class BitHumanAvatarProcessor(FrameProcessor):
     and outputs synchronized video and audio frames for the avatar.
     """
 
+    # Silence pushed once at startup to kick off video generation; one 20ms TTS
+    # frame's worth is enough, and longer primes only delay the first real audio
+    _INITIAL_SILENCE_MS = 20
+
     def __init__(
         self,
         model_path: str,
@@ -142,13 +154,14 @@ class BitHumanAvatarProcessor(FrameProcessor):
         self._sample_rate: int = 16000
         self._flush_task: Optional[asyncio.Task] = None
         self._tts_active: bool = False
-        self._last_audio_frame_time: Optional[float] = None
         self._flush_delay: float = flush_delay
 
         # Audio duration tracking for precise completion detection
         self._input_audio_duration: float = 0.0
         self._output_audio_duration: float = 0.0
-        self._tts_segment_start_time: Optional[float] = None
+        # Set by the render loop whenever _output_audio_duration advances, so
+        # _smart_flush can wake on progress instead of polling
+        self._output_progress_event = asyncio.Event()
 
     async def _initialize_runtime(self):
         """Initialize the BitHuman runtime."""
@@ -197,10 +210,7 @@ class BitHumanAvatarProcessor(FrameProcessor):
             logger.info("✅ BitHuman runtime fully initialized and ready for TTS audio")
 
         except Exception as e:
-            logger.error(f"❌ Failed to initialize BitHuman runtime: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ Failed to initialize BitHuman runtime: {e}")
             raise
 
     async def start(self, frame: StartFrame):
@@ -215,9 +225,9 @@ class BitHumanAvatarProcessor(FrameProcessor):
             return
 
         try:
-            # Push 100ms of silence (1600 samples at 16kHz)
-            silence_samples = 1600
-            silence_bytes = b"\x00" * (silence_samples * 2)  # 16-bit samples
+            # Push a short prime of silence at the runtime sample rate
+            silence_samples = self._sample_rate * self._INITIAL_SILENCE_MS // 1000
+            silence_bytes = bytes(silence_samples * 2)  # 16-bit samples
 
             await self._runtime.push_audio(
                 silence_bytes,
@@ -289,9 +299,6 @@ class BitHumanAvatarProcessor(FrameProcessor):
                     audio_duration = len(audio_bytes) / 2 / frame.sample_rate
                     self._input_audio_duration += audio_duration
 
-                # Update last audio frame time
-                self._last_audio_frame_time = time.time()
-
                 # Cancel any pending flush task
                 if self._flush_task and not self._flush_task.done():
                     self._flush_task.cancel()
@@ -328,10 +335,8 @@ class BitHumanAvatarProcessor(FrameProcessor):
                     await self._flush_task
                 except asyncio.CancelledError:
                     pass
-            self._last_audio_frame_time = None
             self._input_audio_duration = 0.0
             self._output_audio_duration = 0.0
-            self._tts_segment_start_time = time.time()
             await self.push_frame(frame, direction)
             return
 
@@ -363,12 +368,13 @@ class BitHumanAvatarProcessor(FrameProcessor):
                         )
                         await asyncio.sleep(0.05)  # Give runtime a moment to process
 
-                        # Wait for output to catch up with input
+                        # Wait for output to catch up with input, waking whenever the
+                        # render loop reports new output instead of polling
                         max_wait_time = self._flush_delay * 2
-                        check_interval = 0.05
-                        wait_start = time.time()
+                        progress_event = self._output_progress_event
+                        deadline = time.monotonic() + max_wait_time
 
-                        while time.time() - wait_start < max_wait_time:
+                        while (remaining := deadline - time.monotonic()) > 0:
                             if self._input_audio_duration > 0:
                                 completion_ratio = (
                                     self._output_audio_duration
@@ -379,7 +385,13 @@ class BitHumanAvatarProcessor(FrameProcessor):
                                         f"✅ Audio processing complete: {completion_ratio*100:.1f}%"
                                     )
                                     break
-                            await asyncio.sleep(check_interval)
+                            progress_event.clear()
+                            try:
+                                await asyncio.wait_for(
+                                    progress_event.wait(), timeout=remaining
+                                )
+                            except asyncio.TimeoutError:
+                                pass
 
                         logger.info(
                             "🔚 Calling runtime.flush() to signal end of speech"
@@ -389,10 +401,7 @@ class BitHumanAvatarProcessor(FrameProcessor):
                     except asyncio.CancelledError:
                         logger.debug("🔄 Smart flush cancelled")
                     except Exception as e:
-                        logger.error(f"❌ Error in smart flush: {e}")
-                        import traceback
-
-                        logger.error(traceback.format_exc())
+                        logger.exception(f"❌ Error in smart flush: {e}")
 
                 self._flush_task = asyncio.create_task(_smart_flush())
             await self.push_frame(frame, direction)
@@ -484,10 +493,7 @@ class BitHumanAvatarProcessor(FrameProcessor):
             )
 
         except Exception as e:
-            logger.error(f"❌ Error pushing audio to BitHuman runtime: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ Error pushing audio to BitHuman runtime: {e}")
 
     async def _render_loop(self):
         """Background task that renders BitHuman frames and pushes them downstream."""
@@ -509,9 +515,9 @@ class BitHumanAvatarProcessor(FrameProcessor):
 
                 # Push video frame if available
                 if bh_frame.bgr_image is not None:
+                    # A fresh image per frame: the transport may still hold
+                    # earlier frames in its queues. cvtColor output is contiguous.
                     rgb_image = cv2.cvtColor(bh_frame.bgr_image, cv2.COLOR_BGR2RGB)
-                    if not rgb_image.flags["C_CONTIGUOUS"]:
-                        rgb_image = np.ascontiguousarray(rgb_image)
 
                     video_frame = OutputImageRawFrame(
                         image=rgb_image,
@@ -533,6 +539,7 @@ class BitHumanAvatarProcessor(FrameProcessor):
                     # Track output audio duration
                     audio_duration = bh_frame.audio_chunk.duration
                     self._output_audio_duration += audio_duration
+                    self._output_progress_event.set()
 
                     audio_frame = OutputAudioRawFrame(
                         audio=audio_bytes,
@@ -551,10 +558,7 @@ class BitHumanAvatarProcessor(FrameProcessor):
         except asyncio.CancelledError:
             logger.info("⏹️  BitHuman render loop cancelled")
         except Exception as e:
-            logger.error(f"❌ Error in BitHuman render loop: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ Error in BitHuman render loop: {e}")
         finally:
             logger.info(
                 f"✅ Render loop completed. Total frames: {frame_count} "
@@ -810,4 +814,7 @@ if __name__ == "__main__":
     else:
         logging.basicConfig(level=logging.INFO)
 
-    asyncio.run(main(args))
+    if uvloop is not None:
+        uvloop.run(main(args))
+    else:
+        asyncio.run(main(args))
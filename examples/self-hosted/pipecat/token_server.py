@@ -14,7 +14,11 @@ Then access test_client.html in your browser.
 import json
 import os
 import sys
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import parse_qs, urlparse
 
 try:
@@ -24,8 +28,67 @@ except ImportError:
     print("Install it with: pip install livekit")
     sys.exit(1)
 
+# orjson is optional; it encodes straight to bytes and is faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# LiveKit credentials, read once at startup
+LIVEKIT_API_KEY = os.getenv("LIVEKIT_API_KEY")
+LIVEKIT_API_SECRET = os.getenv("LIVEKIT_API_SECRET")
+
+# Tokens are reused per (room, identity) until they are this close to expiring,
+# so repeated requests don't re-sign an identical JWT
+TOKEN_TTL = timedelta(hours=6)
+TOKEN_REFRESH_MARGIN = 60.0  # seconds
+TOKEN_CACHE_SIZE = 1024
+
+# (room, identity) -> (jwt, monotonic expiry), least recently used first
+_token_cache: OrderedDict[tuple[str, str], tuple[str, float]] = OrderedDict()
+# Requests are served on separate threads
+_token_cache_lock = threading.Lock()
+
+
+def get_token(room_name: str, identity: str) -> str:
+    """Return a cached access token for the room and identity, minting one if needed."""
+    key = (room_name, identity)
+    now = time.monotonic()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None and cached[1] - now > TOKEN_REFRESH_MARGIN:
+            _token_cache.move_to_end(key)
+            return cached[0]
+
+    # Signed outside the lock; concurrent misses for one key just both mint
+    token = (
+        api.AccessToken(api_key=LIVEKIT_API_KEY, api_secret=LIVEKIT_API_SECRET)
+        .with_identity(identity)
+        .with_name(identity)
+        .with_ttl(TOKEN_TTL)
+        .with_grants(
+            api.VideoGrants(
+                room_join=True,
+                room=room_name,
+                can_publish=True,
+                can_subscribe=True,
+            )
+        )
+        .to_jwt()
+    )
+    with _token_cache_lock:
+        _token_cache[key] = (token, now + TOKEN_TTL.total_seconds())
+        _token_cache.move_to_end(key)
+        if len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return token
+
 
 class TokenHandler(BaseHTTPRequestHandler):
+    # Every response carries a Content-Length, so clients can keep the
+    # connection open across token requests
+    protocol_version = "HTTP/1.1"
+
     def do_GET(self):
         """Handle GET requests for token generation."""
         parsed_path = urlparse(self.path)
@@ -43,30 +106,9 @@ class TokenHandler(BaseHTTPRequestHandler):
             self.send_error(400, "Missing 'room' parameter")
             return
 
-        # Get LiveKit credentials from environment
-        api_key = os.getenv("LIVEKIT_API_KEY")
-        api_secret = os.getenv("LIVEKIT_API_SECRET")
-
-        if not api_key or not api_secret:
-            self.send_error(500, "LIVEKIT_API_KEY and LIVEKIT_API_SECRET must be set")
-            return
-
         try:
-            # Generate token
-            token = (
-                api.AccessToken(api_key=api_key, api_secret=api_secret)
-                .with_identity(identity)
-                .with_name(identity)
-                .with_grants(
-                    api.VideoGrants(
-                        room_join=True,
-                        room=room_name,
-                        can_publish=True,
-                        can_subscribe=True,
-                    )
-                )
-                .to_jwt()
-            )
+            # Generate token (or reuse a recent one for the same room and identity)
+            token = get_token(room_name, identity)
 
             # Return token as JSON
             response = {
@@ -74,14 +116,19 @@ class TokenHandler(BaseHTTPRequestHandler):
                 "room": room_name,
                 "identity": identity,
             }
+            if orjson is not None:
+                body = orjson.dumps(response)
+            else:
+                body = json.dumps(response).encode()
 
             self.send_response(200)
             self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
             self.send_header(
                 "Access-Control-Allow-Origin", "*"
             )  # Allow CORS for local testing
             self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self.wfile.write(body)
 
         except Exception as e:
             self.send_error(500, f"Error generating token: {str(e)}")
@@ -96,14 +143,15 @@ def main():
     port = 8080
 
     # Check environment variables
-    if not os.getenv("LIVEKIT_API_KEY") or not os.getenv("LIVEKIT_API_SECRET"):
+    if not LIVEKIT_API_KEY or not LIVEKIT_API_SECRET:
         print("Error: LIVEKIT_API_KEY and LIVEKIT_API_SECRET must be set")
         print("\nSet them with:")
         print("  export LIVEKIT_API_KEY='your-api-key'")
         print("  export LIVEKIT_API_SECRET='your-api-secret'")
         sys.exit(1)
 
-    server = HTTPServer(("localhost", port), TokenHandler)
+    # One thread per connection, so a slow client doesn't hold up the others
+    server = ThreadingHTTPServer(("localhost", port), TokenHandler)
     print(f"🚀 Token server running on http://localhost:{port}")
     print("📝 Make sure LIVEKIT_API_KEY and LIVEKIT_API_SECRET are set")
     print("\n💡 Usage:")